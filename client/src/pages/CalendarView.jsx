@@ -12,24 +12,26 @@ function ymd(d) {
   return `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`
 }
 
+// visible month plus the neighbouring days react-calendar shows in the grid
+function monthWindow(d) {
+  const from = new Date(d.getFullYear(), d.getMonth(), 1 - 7)
+  const to = new Date(d.getFullYear(), d.getMonth() + 1, 7)
+  return { from: ymd(from), to: ymd(to) }
+}
+
 export default function CalendarView() {
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
-  const [meetings, setMeetings] = useState([])            
-  const [items, setItems] = useState([])                  
-  const [value, setValue] = useState(new Date())          
+  const [days, setDays] = useState([])
+  const [value, setValue] = useState(new Date())
+  const [activeStart, setActiveStart] = useState(new Date())
   const navigate = useNavigate()
 
-  const load = async () => {
+  const load = async (start) => {
     setLoading(true); setError('')
     try {
-      const [mRes, openRes, doneRes] = await Promise.all([
-        api.get('/meetings', { params: { page: 1, per_page: 200 } }),
-        api.get('/action-items', { params: { status: 'open', page: 1, per_page: 200 } }),
-        api.get('/action-items', { params: { status: 'done', page: 1, per_page: 200 } }),
-      ])
-      setMeetings(mRes.data.items || [])
-      setItems([...(openRes.data.items || []), ...(doneRes.data.items || [])])
+      const { data } = await api.get('/calendar', { params: monthWindow(start) })
+      setDays(data.days || [])
     } catch (e) {
       setError(errMsg(e))
     } finally {
@@ -37,28 +39,19 @@ export default function CalendarView() {
     }
   }
 
-  useEffect(() => { load() }, [])
+  useEffect(() => { load(activeStart) }, [activeStart])
 
   const meetingByDate = useMemo(() => {
     const map = {}
-    for (const m of meetings) {
-      const k = m.date
-      if (!map[k]) map[k] = []
-      map[k].push(m)
-    }
+    for (const d of days) if (d.meetings.length) map[d.date] = d.meetings
     return map
-  }, [meetings])
+  }, [days])
 
   const itemsByDue = useMemo(() => {
     const map = {}
-    for (const it of items) {
-      if (!it.due_date) continue
-      const k = it.due_date
-      if (!map[k]) map[k] = []
-      map[k].push(it)
-    }
+    for (const d of days) if (d.items.length) map[d.date] = d.items
     return map
-  }, [items])
+  }, [days])
 
   const tileContent = ({ date, view }) => {
     if (view !== 'month') return null
@@ -84,68 +77,67 @@ export default function CalendarView() {
       <h2 className="text-xl font-semibold mb-4">Calendar</h2>
 
       {error && <Alert>{error}</Alert>}
-      {loading ? (
-        <Spinner label="Loading calendar…" />
-      ) : (
-        <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-          <div className="bg-white p-3 rounded border">
-            <Calendar
-              onChange={setValue}
-              value={value}
-              tileContent={tileContent}
-              calendarType="gregory"
-              prev2Label={null}
-              next2Label={null}
-            />
-            <div className="text-xs text-gray-600 mt-2 flex gap-3">
-              <span className="inline-flex items-center gap-1">
-                <span className="w-2 h-2 rounded-full bg-[#0091af] inline-block" /> Meeting
-              </span>
-              <span className="inline-flex items-center gap-1">
-                <span className="w-2 h-2 rounded-full bg-amber-500 inline-block" /> Item due
-              </span>
-            </div>
+      {loading && <Spinner label="Loading calendar…" />}
+      <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+        <div className="bg-white p-3 rounded border">
+          <Calendar
+            onChange={setValue}
+            value={value}
+            tileContent={tileContent}
+            activeStartDate={activeStart}
+            onActiveStartDateChange={({ activeStartDate }) => setActiveStart(activeStartDate)}
+            calendarType="gregory"
+            prev2Label={null}
+            next2Label={null}
+          />
+          <div className="text-xs text-gray-600 mt-2 flex gap-3">
+            <span className="inline-flex items-center gap-1">
+              <span className="w-2 h-2 rounded-full bg-[#0091af] inline-block" /> Meeting
+            </span>
+            <span className="inline-flex items-center gap-1">
+              <span className="w-2 h-2 rounded-full bg-amber-500 inline-block" /> Item due
+            </span>
           </div>
+        </div>
 
-          <div className="space-y-4">
-            <div className="border rounded p-3 bg-white">
-              <h3 className="font-medium mb-2">Meetings on {selectedKey}</h3>
-              {todaysMeetings.length === 0 ? (
-                <p className="text-sm text-gray-600">No meetings.</p>
-              ) : (
-                <ul className="space-y-2">
-                  {todaysMeetings.map(m => (
-                    <li key={m.id} className="flex items-center justify-between">
-                      <span className="truncate">{m.title}</span>
-                      <button
-                        className="text-[#0091af] hover:underline ml-2"
-                        onClick={() => navigate(`/meetings/${m.id}`)}
-                      >
-                        Open
-                      </button>
-                    </li>
-                  ))}
-                </ul>
-              )}
-            </div>
+        <div className="space-y-4">
+          <div className="border rounded p-3 bg-white">
+            <h3 className="font-medium mb-2">Meetings on {selectedKey}</h3>
+            {todaysMeetings.length === 0 ? (
+              <p className="text-sm text-gray-600">No meetings.</p>
+            ) : (
+              <ul className="space-y-2">
+                {todaysMeetings.map(m => (
+                  <li key={m.id} className="flex items-center justify-between">
+                    <span className="truncate">{m.title}</span>
+                    <button
+                      className="text-[#0091af] hover:underline ml-2"
+                      onClick={() => navigate(`/meetings/${m.id}`)}
+                    >
+                      Open
+                    </button>
+                  </li>
+                ))}
+              </ul>
+            )}
+          </div>
 
-            <div className="border rounded p-3 bg-white">
-              <h3 className="font-medium mb-2">Items due on {selectedKey}</h3>
-              {todaysDueItems.length === 0 ? (
-                <p className="text-sm text-gray-600">No due items.</p>
-              ) : (
-                <ul className="space-y-2">
-                  {todaysDueItems.map(it => (
-                    <li key={it.id} className="text-sm">
-                      #{it.id} — {it.title} <span className="text-gray-500">({it.status})</span>
-                    </li>
-                  ))}
-                </ul>
-              )}
-            </div>
+          <div className="border rounded p-3 bg-white">
+            <h3 className="font-medium mb-2">Items due on {selectedKey}</h3>
+            {todaysDueItems.length === 0 ? (
+              <p className="text-sm text-gray-600">No due items.</p>
+            ) : (
+              <ul className="space-y-2">
+                {todaysDueItems.map(it => (
+                  <li key={it.id} className="text-sm">
+                    #{it.id} — {it.title} <span className="text-gray-500">({it.status})</span>
+                  </li>
+                ))}
+              </ul>
+            )}
           </div>
         </div>
-      )}
+      </div>
     </div>
   )
 }
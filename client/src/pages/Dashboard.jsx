@@ -11,41 +11,24 @@ export default function Dashboard() {
   const [openCount, setOpenCount] = useState(0)
   const [doneCount, setDoneCount] = useState(0)
   const [dueThisWeek, setDueThisWeek] = useState(0)
+  const [overdueCount, setOverdueCount] = useState(0)
   const [meetingsThisMonth, setMeetingsThisMonth] = useState(0)
 
-  const next7 = useMemo(() => {
-    const d = new Date()
-    d.setDate(d.getDate() + 7)
-    return d.toISOString().slice(0,10)
-  }, [])
-
   const yyyymm = useMemo(() => {
     const now = new Date()
-    return { y: now.getFullYear(), m: now.getMonth() + 1 }
+    return `${now.getFullYear()}-${String(now.getMonth() + 1).padStart(2, '0')}`
   }, [])
 
   const load = async () => {
     setLoading(true); setError('')
     try {
-      
-      const openRes = await api.get('/action-items', { params: { status: 'open', page: 1, per_page: 100 } })
-      setOpenCount(openRes.data.total || openRes.data.items.length)
-
- 
-      const doneRes = await api.get('/action-items', { params: { status: 'done', page: 1, per_page: 100 } })
-      setDoneCount(doneRes.data.total || doneRes.data.items.length)
-
-      
-      const dueRes = await api.get('/action-items', { params: { status: 'open', due_before: next7, page: 1, per_page: 100 } })
-      setDueThisWeek(dueRes.data.total || dueRes.data.items.length)
-
-     
-      const meetRes = await api.get('/meetings', { params: { page: 1, per_page: 100 } })
-      const inMonth = meetRes.data.items.filter(m => {
-        const [yy, mm] = (m.date || '').split('-').map(Number)
-        return yy === yyyymm.y && mm === yyyymm.m
-      }).length
-      setMeetingsThisMonth(inMonth)
+      const { data } = await api.get('/stats', { params: { due_soon_days: 7 } })
+      setOpenCount(data.items.open)
+      setDoneCount(data.items.done)
+      setDueThisWeek(data.items.due_soon)
+      setOverdueCount(data.items.overdue)
+      const month = data.meetings.per_month.find(m => m.month === yyyymm)
+      setMeetingsThisMonth(month ? month.count : 0)
     } catch (e) {
       setError(errMsg(e))
     } finally {
@@ -73,6 +56,7 @@ export default function Dashboard() {
             <StatCard label="Open items" value={openCount} />
             <StatCard label="Done items" value={doneCount} />
             <StatCard label="Due next 7 days" value={dueThisWeek} />
+            <StatCard label="Overdue" value={overdueCount} />
             <StatCard label="Meetings this month" value={meetingsThisMonth} />
           </div>
 
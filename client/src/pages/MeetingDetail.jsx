@@ -1,6 +1,6 @@
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { useParams } from 'react-router-dom'
-import api from '../lib/api'
+import api, { streamEvents } from '../lib/api'
 import { errMsg } from '../lib/errors'
 import Spinner from '../components/Spinner'
 import Alert from '../components/Alert'
@@ -30,6 +30,7 @@ export default function MeetingDetail() {
   const [aiError, setAiError] = useState('')
   const [aiItems, setAiItems] = useState([])       
   const [aiSelected, setAiSelected] = useState({}) 
+  const aiAbort = useRef(null)
 
   
   const [showAdd, setShowAdd] = useState(false)
@@ -37,19 +38,20 @@ export default function MeetingDetail() {
   const [due, setDue] = useState('')
   const [assignee, setAssignee] = useState('')
 
+  const syncToken = useRef(null)
+
   const toggleSelect = (i) =>
     setAiSelected(prev => ({ ...prev, [i]: !prev[i] }))
 
   const load = async () => {
     setLoading(true); setError('')
     try {
-      const [mRes, iRes] = await Promise.all([
-        api.get(`/meetings/${id}`),
-        api.get('/action-items', { params: { page: 1, per_page: 100 } })
-      ])
-      setMeeting(mRes.data)
-      setNotesText(mRes.data.notes || '')
-      setItems(iRes.data.items.filter(it => it.meeting_id === Number(id)))
+      const res = await api.get(`/meetings/${id}`, { params: { include: 'action_items' } })
+      const data = res.data
+      syncToken.current = res.headers['x-sync-token'] || null
+      setMeeting(data)
+      setNotesText(data.notes || '')
+      setItems(data.action_items || [])
     } catch (e) {
       setError(errMsg(e))
     } finally {
@@ -59,13 +61,37 @@ export default function MeetingDetail() {
 
   useEffect(() => { load() }, [id])
 
+  // after a write, fetch only what changed since the last load/sync
+  const refresh = async () => {
+    if (!syncToken.current) return load()
+    const { data } = await api.get('/sync', { params: { since: syncToken.current } })
+    if (data.reset) return load()
+    syncToken.current = data.token
+    const mid = Number(id)
+    if (data.deleted.meetings.includes(mid)) { setMeeting(null); setItems([]); return }
+    const changed = data.meetings.find(m => m.id === mid)
+    if (changed) setMeeting(changed)
+    const gone = new Set(data.deleted.items)
+    const upserts = data.items.filter(it => it.meeting_id === mid)
+    setItems(prev => {
+      const byId = new Map(prev.filter(it => !gone.has(it.id)).map(it => [it.id, it]))
+      for (const it of upserts) byId.set(it.id, it)
+      // same order as the server: due date (no date last), then newest first
+      return [...byId.values()].sort((a, b) =>
+        (a.due_date === null) - (b.due_date === null)
+        || (a.due_date || '').localeCompare(b.due_date || '')
+        || b.id - a.id)
+    })
+  }
+
+  useEffect(() => () => aiAbort.current?.abort(), [])
+
   
   const saveHeader = async (e) => {
     e.preventDefault()
     try {
       await api.patch(`/meetings/${id}`, { title: editTitle, date: editDate })
-      const { data } = await api.get(`/meetings/${id}`)
-      setMeeting(data)
+      await refresh()
       setEditing(false)
     } catch (e) {
       alert(errMsg(e))
@@ -76,8 +102,7 @@ export default function MeetingDetail() {
   const saveNotes = async () => {
     try {
       await api.patch(`/meetings/${id}`, { notes: notesText })
-      const { data } = await api.get(`/meetings/${id}`)
-      setMeeting(data)
+      await refresh()
       alert('Notes saved.')
     } catch (e) {
       alert(errMsg(e))
@@ -87,16 +112,22 @@ export default function MeetingDetail() {
   const askAI = async () => {
     const text = (notesText || '').trim()
     if (!text) { alert('No notes to analyze.'); return }
-    setAiLoading(true); setAiError('')
+    aiAbort.current?.abort()
+    const ctrl = new AbortController()
+    aiAbort.current = ctrl
+    setAiLoading(true); setAiError(''); setAiItems([]); setAiSelected({})
     try {
-      const { data } = await api.post('/ai/suggest', { notes: text })
-      const cleaned = (data.items || [])
-        .map(x => x.replace(/^\s*[-*\d\.\)]\s*/, '').trim())
-        .filter(Boolean)
-      setAiItems(cleaned)
-      setAiSelected({})
+      // suggestions stream in one bullet at a time
+      await streamEvents('/ai/suggest/stream', { notes: text }, (event, data) => {
+        if (event === 'item') {
+          const cleaned = data.text.replace(/^\s*[-*\d\.\)]\s*/, '').trim()
+          if (cleaned) setAiItems(prev => [...prev, cleaned])
+        } else if (event === 'error') {
+          setAiError(data.error)
+        }
+      }, ctrl.signal)
     } catch (e) {
-      setAiError(errMsg(e))
+      if (e.name !== 'AbortError') setAiError(errMsg(e))
     } finally {
       setAiLoading(false)
     }
@@ -106,15 +137,16 @@ export default function MeetingDetail() {
     const chosen = aiItems.map((txt, i) => ({ i, txt })).filter(({ i }) => aiSelected[i])
     if (chosen.length === 0) { alert('Select at least one suggestion.'); return }
     try {
-      for (const { txt } of chosen) {
-        await api.post('/action-items', {
+      await api.post('/action-items/batch', {
+        ops: chosen.map(({ txt }) => ({
+          op: 'create',
           meeting_id: Number(id),
           title: txt,
           status: 'open'
-        })
-      }
+        }))
+      })
       setAiItems([]); setAiSelected({})
-      await load()
+      await refresh()
       alert(`Created ${chosen.length} action item(s).`)
     } catch (e) {
       alert(errMsg(e))
@@ -134,7 +166,7 @@ export default function MeetingDetail() {
         status: 'open'
       })
       setTitle(''); setDue(''); setAssignee(''); setShowAdd(false)
-      load()
+      await refresh()
     } catch (e) {
       alert(errMsg(e))
     }
@@ -143,7 +175,7 @@ export default function MeetingDetail() {
   const toggleStatus = async (it) => {
     try {
       await api.patch(`/action-items/${it.id}`, { status: it.status === 'open' ? 'done' : 'open' })
-      load()
+      await refresh()
     } catch (e) {
       alert(errMsg(e))
     }
@@ -153,7 +185,7 @@ export default function MeetingDetail() {
     if (!confirm('Delete this item?')) return
     try {
       await api.delete(`/action-items/${it.id}`)
-      load()
+      await refresh()
     } catch (e) {
       alert(errMsg(e))
     }
@@ -6,20 +6,23 @@ from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 from flask_cors import CORS
 from .errors import register_error_handlers
+from .replica import RoutingSession
 import os
 
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 ma = Marshmallow()
 bcrypt = Bcrypt()
 jwt = JWTManager()
 migrate = Migrate()
 
-def create_app():
+def create_app(profile=None):
+    from app.config import config_for
+
     app = Flask(__name__)
-    app.config.from_object('app.config.Config')
+    app.config.from_object(config_for(profile or os.getenv("APP_PROFILE", "dev")))
 
-    CORS(app, supports_credentials=True)
+    CORS(app, supports_credentials=True, expose_headers=["X-Sync-Token", "Server-Timing"])
 
     db.init_app(app)
     ma.init_app(app)
@@ -33,11 +36,38 @@ def create_app():
     from app.meetings import meetings_bp
     from app.action_items import items_bp
     from app.ai import ai_bp   
+    from app.stats import stats_bp
+    from app.calendar import calendar_bp
+    from app.export import export_bp
+    from app.importer import import_bp
+    from app.sync import sync_bp
+    from app.cli import register_commands
+    from app.ai_cache import suggestion_cache
+    from app.jobs import job_queue
+    from app.metrics import metrics
+    from app.passwords import password_hasher
+    from app.identity import user_cache
+    from app import serializers, sqlite_pragmas
 
     app.register_blueprint(routes.bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(meetings_bp)
     app.register_blueprint(items_bp)
     app.register_blueprint(ai_bp)  
+    app.register_blueprint(stats_bp)
+    app.register_blueprint(calendar_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(import_bp)
+    app.register_blueprint(sync_bp)
+
+    sqlite_pragmas.init_app(app)
+    serializers.init_app(app)
+    suggestion_cache.init_app(app)
+    job_queue.init_app(app)
+    password_hasher.init_app(app)
+    user_cache.init_app(app)
+    metrics.init_app(app)
+    register_error_handlers(app)
+    register_commands(app)
 
     return app
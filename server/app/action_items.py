@@ -1,59 +1,83 @@
+from collections import Counter
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required
+from sqlalchemy import delete, false, insert, update
 from . import db
+from .identity import current_uid, owned
 from .models import ActionItem, Meeting
+from .etag import bump_data_version, conditional, record_deletes
+from .pagination import SortKey, paginate, sort_clauses
+from .replica import replica_read
 from .req import require_json
-from .validators import parse_iso_date, ensure_nonempty, ensure_status  
+from .serializers import columns_for, item_json, sparse
+from .stats import record_items
+from .validators import parse_date_range, parse_iso_date, ensure_nonempty, ensure_optional_str, ensure_status  
 
 items_bp = Blueprint("action_items", __name__, url_prefix="/action-items")
 
-def _paginate(q):
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 10, type=int)
-    per_page = max(1, min(per_page, 50))
-    return q.paginate(page=page, per_page=per_page, error_out=False)
+ITEM_SORT = [
+    SortKey(ActionItem.due_date.is_(None), False, lambda it: it.due_date is None),
+    SortKey(ActionItem.due_date, False, lambda it: it.due_date),
+    SortKey(ActionItem.id, True, lambda it: it.id),
+]
 
-@items_bp.get("")
-@jwt_required()
-def list_my_items():
-    uid = int(get_jwt_identity())
-    status = request.args.get("status")
-    due_before = request.args.get("due_before")
-    query = ActionItem.query.filter_by(user_id=uid)
+def item_sort(bounded=False):
+    # NULLs are excluded by a due-date bound, so the nulls-last key is pinned and not sorted on.
+    return ITEM_SORT[1:] if bounded else ITEM_SORT
+
+ITEM_COLUMNS = columns_for(ActionItem, item_json)
+
+def items_query(uid, status=None, due_before=None, due_after=None, columns=None):
+    """
+    The user's items, filtered and ordered like GET /action-items. With
+    `columns`, rows are just those columns instead of entities.
+    """
+    query = (db.session.query(*columns) if columns else ActionItem.query).filter(ActionItem.user_id == uid)
 
     if status in {"open", "done"}:
         query = query.filter(ActionItem.status == status)
 
+    if due_before or due_after:
+        query = query.filter(ActionItem.due_date.is_(None) == false())
     if due_before:
-        try:
-            dt = parse_iso_date(due_before)
-            query = query.filter(ActionItem.due_date != None, ActionItem.due_date <= dt)
-        except ValueError as ex:
-            return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+        query = query.filter(ActionItem.due_date <= due_before)
+    if due_after:
+        query = query.filter(ActionItem.due_date >= due_after)
+
+    return query.order_by(*sort_clauses(item_sort(bool(due_before or due_after))))
 
-    query = query.order_by(ActionItem.due_date.asc().nulls_last(), ActionItem.id.desc())
-    page_data = _paginate(query)
-    items = [{
-        "id": it.id,
-        "meeting_id": it.meeting_id,
-        "title": it.title,
-        "due_date": it.due_date.isoformat() if it.due_date else None,
-        "status": it.status,
-        "assignee": it.assignee,
-        "created_at": it.created_at.isoformat(),
-    } for it in page_data.items]
-
-    return jsonify({
-        "items": items,
-        "page": page_data.page,
-        "pages": page_data.pages,
-        "total": page_data.total
-    }), 200
+def item_filters(args):
+    """
+    Read the list filters (status, due_before, from, to) from query args;
+    returns (status, due_before, due_after) or raises ValueError.
+    """
+    due_before = args.get("due_before")
+    dt = parse_iso_date(due_before) if due_before else None
+    start, end = parse_date_range(args.get("from"), args.get("to"))
+    if end and (dt is None or end < dt):
+        dt = end
+    return args.get("status"), dt, start
+
+@items_bp.get("")
+@jwt_required()
+@replica_read
+@conditional
+def list_my_items():
+    uid = current_uid()
+    try:
+        dump = sparse(item_json, request.args.get("fields"))
+        status, dt, start = item_filters(request.args)
+        columns = columns_for(ActionItem, dump, [ActionItem.due_date, ActionItem.id])
+        rows, meta = paginate(items_query(uid, status, dt, start, columns), item_sort(bool(dt or start)))
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+
+    return jsonify({"items": [dump(it) for it in rows], **meta}), 200
 
 @items_bp.post("")
 @jwt_required()
 def create_item():
-    uid = int(get_jwt_identity())
+    uid = current_uid()
     data, err = require_json()                
     if err:
         return err
@@ -66,7 +90,7 @@ def create_item():
     except ValueError as ex:
         return jsonify({"error": "ValidationError", "message": str(ex)}), 400
 
-    meeting = Meeting.query.filter_by(id=meeting_id, user_id=uid).first()
+    meeting = owned(Meeting, meeting_id)
     if not meeting:
         return jsonify({"error": "NotFound", "message": "meeting not found"}), 404  
 
@@ -92,14 +116,16 @@ def create_item():
         assignee=data.get("assignee"),
     )
     db.session.add(item)
+    item.sync_version = bump_data_version(uid)
+    record_items(uid, {status_val: 1})
     db.session.commit()
     return jsonify({"id": item.id}), 201
 
 @items_bp.patch("/<int:item_id>")
 @jwt_required()
 def update_item(item_id):
-    uid = int(get_jwt_identity())
-    it = ActionItem.query.filter_by(id=item_id, user_id=uid).first()
+    uid = current_uid()
+    it = owned(ActionItem, item_id)
     if not it:
         return jsonify({"error": "NotFound", "message": "not found"}), 404 
 
@@ -124,23 +150,168 @@ def update_item(item_id):
 
     if "status" in data:
         try:
-            it.status = ensure_status(data["status"])
+            new_status = ensure_status(data["status"])
         except ValueError as ex:
             return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+        if new_status != it.status:
+            record_items(uid, {it.status: -1, new_status: 1})
+        it.status = new_status
 
     if "assignee" in data:
         it.assignee = data.get("assignee")
 
+    it.sync_version = bump_data_version(uid)
     db.session.commit()
     return jsonify({"message": "updated"}), 200
 
 @items_bp.delete("/<int:item_id>")
 @jwt_required()
 def delete_item(item_id):
-    uid = int(get_jwt_identity())
-    it = ActionItem.query.filter_by(id=item_id, user_id=uid).first()
+    uid = current_uid()
+    it = owned(ActionItem, item_id)
     if not it:
         return jsonify({"error": "NotFound", "message": "not found"}), 404 
+    record_items(uid, {it.status: -1})
+    record_deletes(uid, bump_data_version(uid), item_ids=[it.id])
     db.session.delete(it)
     db.session.commit()
     return jsonify({"message": "deleted"}), 204
+
+MAX_BATCH_OPS = 100
+
+def _is_id(value):
+    # JSON true/false arrive as bool, which is an int subclass
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def item_fields(op, partial):
+    """
+    Validate the writable fields of one item (batch op or import row) with the
+    same rules as POST/PATCH; returns a column dict or raises ValueError.
+    """
+    fields = {}
+    if not partial or "title" in op:
+        fields["title"] = ensure_nonempty(ensure_optional_str(op.get("title"), "title"), "title")
+    if "due_date" in op or not partial:
+        fields["due_date"] = parse_iso_date(op["due_date"]) if op.get("due_date") else None
+    if partial and "status" in op:
+        fields["status"] = ensure_status(op["status"])  # like PATCH: null is not a status
+    elif not partial:
+        fields["status"] = ensure_status(op.get("status") or "open")
+    if "assignee" in op or not partial:
+        fields["assignee"] = ensure_optional_str(op.get("assignee"), "assignee")
+    return fields
+
+@items_bp.post("/batch")
+@jwt_required()
+def batch_items():
+    uid = current_uid()
+    data, err = require_json()
+    if err:
+        return err
+    if not isinstance(data, dict):
+        return jsonify({"error": "BadRequest", "message": "JSON body must be an object"}), 400
+
+    ops = data.get("ops")
+    if not isinstance(ops, list) or not ops:
+        return jsonify({"error": "ValidationError", "message": "ops must be a non-empty list"}), 400
+    if len(ops) > MAX_BATCH_OPS:
+        return jsonify({"error": "ValidationError", "message": f"at most {MAX_BATCH_OPS} ops per batch"}), 400
+
+    # Pass 1: validate every op without touching the database.
+    results, parsed = [], []
+    seen_ids = set()
+    for i, op in enumerate(ops):
+        kind = op.get("op") if isinstance(op, dict) else None
+        try:
+            if kind == "create":
+                meeting_id = op.get("meeting_id")
+                if not _is_id(meeting_id):
+                    raise ValueError("meeting_id is required")
+                fields = item_fields(op, partial=False)
+                fields["meeting_id"] = meeting_id
+            elif kind in {"update", "delete"}:
+                item_id = op.get("id")
+                if not _is_id(item_id):
+                    raise ValueError("id is required")
+                if item_id in seen_ids:
+                    raise ValueError("id appears more than once in this batch")
+                seen_ids.add(item_id)
+                fields = item_fields(op, partial=True) if kind == "update" else {}
+                fields["id"] = item_id
+            else:
+                raise ValueError("op must be one of ['create', 'delete', 'update']")
+        except ValueError as ex:
+            results.append({"index": i, "op": kind, "status": 400, "error": "ValidationError", "message": str(ex)})
+            parsed.append(None)
+            continue
+        results.append({"index": i, "op": kind, "status": None})
+        parsed.append((kind, fields))
+
+    # Pass 2: ownership, one IN query per table.
+    meeting_ids = {p[1]["meeting_id"] for p in parsed if p and p[0] == "create"}
+    owned_meetings = set()
+    if meeting_ids:
+        owned_meetings = {mid for (mid,) in db.session.query(Meeting.id).filter(
+            Meeting.user_id == uid, Meeting.id.in_(meeting_ids))}
+    owned_items = {}
+    if seen_ids:
+        owned_items = dict(db.session.query(ActionItem.id, ActionItem.status).filter(
+            ActionItem.user_id == uid, ActionItem.id.in_(seen_ids)))
+
+    for res, p in zip(results, parsed):
+        if not p:
+            continue
+        kind, fields = p
+        if kind == "create" and fields["meeting_id"] not in owned_meetings:
+            res.update(status=404, error="NotFound", message="meeting not found")
+        elif kind != "create" and fields["id"] not in owned_items:
+            res.update(status=404, error="NotFound", message="not found")
+
+    if any(res["status"] for res in results):
+        return jsonify({
+            "error": "ValidationError",
+            "message": "batch rejected; no operations were applied",
+            "results": results,
+        }), 400
+
+    # Pass 3: apply as bulk statements and commit once.
+    version = bump_data_version(uid)
+    creates = [(res, dict(fields, user_id=uid, sync_version=version))
+               for res, (kind, fields) in zip(results, parsed) if kind == "create"]
+    updates = [(res, dict(fields, sync_version=version))
+               for res, (kind, fields) in zip(results, parsed) if kind == "update"]
+    deletes = [(res, fields["id"]) for res, (kind, fields) in zip(results, parsed) if kind == "delete"]
+
+    if creates:
+        new_ids = db.session.scalars(
+            insert(ActionItem).returning(ActionItem.id, sort_by_parameter_order=True),
+            [row for _, row in creates],
+        ).all()
+        for (res, _), new_id in zip(creates, new_ids):
+            res.update(status=201, id=new_id)
+    if updates:
+        db.session.execute(update(ActionItem), [row for _, row in updates])
+        for res, row in updates:
+            res.update(status=200, id=row["id"])
+    if deletes:
+        record_deletes(uid, version, item_ids=[iid for _, iid in deletes])
+        db.session.execute(
+            delete(ActionItem).where(ActionItem.id.in_([iid for _, iid in deletes])),
+            execution_options={"synchronize_session": False},
+        )
+        for res, iid in deletes:
+            res.update(status=204, id=iid)
+
+    status_deltas = Counter(row["status"] for _, row in creates)
+    for _, row in updates:
+        if "status" in row:
+            status_deltas[owned_items[row["id"]]] -= 1
+            status_deltas[row["status"]] += 1
+    for _, iid in deletes:
+        status_deltas[owned_items[iid]] -= 1
+    record_items(uid, status_deltas)
+
+    db.session.commit()
+    for res in results:
+        res.pop("index")
+    return jsonify({"results": results}), 200
@@ -1,29 +1,241 @@
-from flask import Blueprint, request, jsonify
+import json
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from flask_jwt_extended import jwt_required
 from openai import OpenAI
-from .config import Config
+from .ai_cache import cache_key, suggestion_cache
+from .ai_chunking import estimate_tokens, map_reduce
+from .ai_stub import StubClient
+from .extractors import get_extractor, to_candidates
+from .identity import current_uid, owned
+from .jobs import QueueFull, job_queue
+from .metrics import ai_call
+from .models import AiJob
 
 ai_bp = Blueprint("ai", __name__, url_prefix="/ai")
-client = OpenAI(api_key=Config.OPENAI_API_KEY)
+_client = None
+
+MODEL = "gpt-4o-mini"
+SYSTEM_PROMPT = "You are an assistant that extracts clear, concise action items from meeting notes."
+USER_PROMPT = "Meeting notes:\n{notes}\n\nList 3–5 actionable items as short bullet points."
+
+def get_client():
+    global _client
+    if _client is None:
+        if current_app.config["AI_PROVIDER"] == "stub":
+            _client = StubClient(latency=current_app.config["AI_STUB_LATENCY"])
+        else:
+            _client = OpenAI(api_key=current_app.config["OPENAI_API_KEY"])
+    return _client
+
+def complete(notes, client=None, timeout=None):
+    client = client or get_client()
+    with ai_call("complete"):
+        resp = client.chat.completions.create(
+            model=MODEL,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT.format(notes=notes)}
+            ],
+            max_tokens=200,
+            timeout=timeout or current_app.config["AI_TIMEOUT"],
+        )
+    return resp.choices[0].message.content.strip().split("\n")
+
+def _suggestion_key(notes):
+    return cache_key(notes, MODEL, SYSTEM_PROMPT + USER_PROMPT)
+
+def suggest(notes):
+    """
+    Extract suggestions from notes; long notes are chunked and the chunks
+    completed concurrently, so latency tracks the slowest chunk.
+    """
+    cfg = current_app.config
+    client = get_client()
+    if cfg["AI_PREFILTER"]:
+        notes = get_extractor("local").prefilter(notes) or notes
+    if estimate_tokens(notes) <= cfg["AI_CHUNK_TOKENS"]:
+        return complete(notes, client)
+    # chunk workers run outside the app context, so resolve config up front
+    timeout = cfg["AI_TIMEOUT"]
+    return map_reduce(
+        notes, lambda chunk: complete(chunk, client, timeout), cfg["AI_CHUNK_TOKENS"], cfg["AI_CHUNK_CONCURRENCY"]
+    )
+
+def _complete_and_cache(notes):
+    suggestions = suggest(notes)
+    suggestion_cache.set(_suggestion_key(notes), suggestions)
+    return suggestions
+
+def _extracted(extractor, notes):
+    candidates = extractor.extract(notes)
+    return jsonify({
+        "items": [c["title"] for c in candidates],
+        "candidates": candidates,
+        "engine": extractor.name,
+    }), 200
+
+def _job_json(job):
+    items = json.loads(job.items) if job.items else None
+    return {
+        "id": job.id,
+        "status": job.status,
+        "items": items,
+        "candidates": to_candidates(items) if items else None,
+        "error": job.error,
+        "created_at": job.created_at.isoformat(),
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+def _notes_arg():
+    """
+    The body's `notes` if it is a non-empty string, else None (checked before
+    it is normalized into a cache key or handed to an extractor).
+    """
+    data = request.get_json() or {}
+    notes = data.get("notes") if isinstance(data, dict) else None
+    return notes if isinstance(notes, str) and notes else None
 
 @ai_bp.post("/suggest")
 @jwt_required()
 def suggest_items():
-    data = request.get_json() or {}
-    notes = data.get("notes")
-    if not notes:
+    notes = _notes_arg()
+    if notes is None:
         return jsonify({"error": "notes required"}), 400
 
-    try:
-        resp = client.chat.completions.create(
-            model="gpt-4o-mini",
+    engine = request.args.get("engine") or current_app.config["AI_EXTRACTOR"]
+    if engine not in {"llm", "auto"}:
+        try:
+            return _extracted(get_extractor(engine), notes)
+        except ValueError as ex:
+            return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+
+    # Cache-Control: no-cache skips the lookup but still refreshes the stored entry
+    key = _suggestion_key(notes)
+    if "no-cache" in request.headers.get("Cache-Control", ""):
+        suggestion_cache.bypass()
+        suggestions = None
+    else:
+        suggestions = suggestion_cache.get(key)
+    cached = suggestions is not None
+
+    # ?async=1: hand the completion to the job pool and let the client poll
+    if not cached and request.args.get("async") in {"1", "true"}:
+        uid = current_uid()
+        try:
+            job = job_queue.enqueue(uid, key, notes, _complete_and_cache)
+        except QueueFull:
+            return jsonify({"error": "Busy", "message": "too many pending AI jobs, retry shortly"}), 503
+        resp = jsonify(_job_json(job))
+        resp.headers["Location"] = f"/ai/jobs/{job.id}"
+        return resp, 202
+
+    if not cached:
+        try:
+            suggestions = _complete_and_cache(notes)
+        except Exception as e:
+            if engine == "auto":
+                current_app.logger.warning("LLM extraction failed, using local engine: %s", e)
+                return _extracted(get_extractor("local"), notes)
+            return jsonify({"error": str(e)}), 500
+
+    resp = jsonify({"items": suggestions, "candidates": to_candidates(suggestions), "engine": "llm"})
+    resp.headers["X-Cache"] = "HIT" if cached else "MISS"
+    return resp, 200
+
+def _sse(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def _sse_item(line):
+    candidates = to_candidates([line])
+    return _sse("item", {"text": line, "candidate": candidates[0] if candidates else None})
+
+def _stream_lines(notes):
+    """
+    Yield complete lines of the completion as the model produces them.
+    Closing this generator closes the upstream HTTP stream.
+    """
+    cfg = current_app.config
+    if cfg["AI_PREFILTER"]:
+        notes = get_extractor("local").prefilter(notes) or notes
+    with ai_call("stream"):
+        stream = get_client().chat.completions.create(
+            model=MODEL,
             messages=[
-                {"role": "system", "content": "You are an assistant that extracts clear, concise action items from meeting notes."},
-                {"role": "user", "content": f"Meeting notes:\n{notes}\n\nList 3–5 actionable items as short bullet points."}
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT.format(notes=notes)}
             ],
-            max_tokens=200
+            max_tokens=cfg["AI_STREAM_MAX_TOKENS"],
+            timeout=cfg["AI_TIMEOUT"],
+            stream=True,
         )
-        suggestions = resp.choices[0].message.content.strip().split("\n")
-        return jsonify({"items": suggestions}), 200
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        buf = ""
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                buf += chunk.choices[0].delta.content or ""
+                while "\n" in buf:
+                    line, buf = buf.split("\n", 1)
+                    if line.strip():
+                        yield line
+            if buf.strip():
+                yield buf
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+@ai_bp.post("/suggest/stream")
+@jwt_required()
+def suggest_stream():
+    """
+    Server-Sent Events variant of /suggest: one `item` event per bullet as
+    soon as the model finishes the line, then `done` (or `error`).
+    """
+    notes = _notes_arg()
+    if notes is None:
+        return jsonify({"error": "notes required"}), 400
+
+    key = _suggestion_key(notes)
+    cached = None
+    if "no-cache" in request.headers.get("Cache-Control", ""):
+        suggestion_cache.bypass()
+    else:
+        cached = suggestion_cache.get(key)
+
+    def events():
+        if cached is not None:
+            for line in cached:
+                yield _sse_item(line)
+            yield _sse("done", {"count": len(cached), "cached": True})
+            return
+        lines = []
+        try:
+            # a client disconnect surfaces as GeneratorExit here, which closes _stream_lines
+            for line in _stream_lines(notes):
+                lines.append(line)
+                yield _sse_item(line)
+        except Exception as e:
+            yield _sse("error", {"error": str(e)})
+            return
+        suggestion_cache.set(key, lines)
+        yield _sse("done", {"count": len(lines), "cached": False})
+
+    resp = Response(stream_with_context(events()), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+@ai_bp.get("/jobs/<job_id>")
+@jwt_required()
+def get_job(job_id):
+    job = owned(AiJob, job_id)
+    if not job:
+        return jsonify({"error": "NotFound", "message": "not found"}), 404
+    job_queue.recover(job, _complete_and_cache)
+    return jsonify(_job_json(job)), 200
+
+@ai_bp.get("/cache/stats")
+@jwt_required()
+def cache_stats():
+    return jsonify(suggestion_cache.snapshot()), 200
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from . import db
+
+
+def normalize_notes(notes: str):
+    """
+    Collapse whitespace so trivially different submissions of the same notes share a key.
+    """
+    return " ".join(notes.split())
+
+
+def cache_key(notes: str, model: str, prompt: str):
+    h = hashlib.sha256()
+    for part in (model, prompt, normalize_notes(notes)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class SuggestionCache:
+    """
+    Two-tier cache for AI suggestions: a per-process LRU with TTL, backed
+    optionally by the app database (AI_CACHE_BACKEND="db") so every worker
+    shares hits. The shared table is pruned of expired rows, and down to
+    AI_CACHE_MAX_ROWS, every AI_CACHE_PRUNE_EVERY writes of each process
+    (or with `flask prune-ai-cache`).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.ttl = 86400
+        self.max_entries = 1024
+        self.shared = False
+        self.max_rows = 100000
+        self.prune_every = 100
+        self._writes = 0
+        self.stats = {"memory_hits": 0, "shared_hits": 0, "misses": 0, "bypassed": 0}
+
+    def init_app(self, app):
+        self.ttl = app.config["AI_CACHE_TTL"]
+        self.max_entries = app.config["AI_CACHE_MAX_ENTRIES"]
+        self.shared = app.config["AI_CACHE_BACKEND"] == "db"
+        self.max_rows = app.config["AI_CACHE_MAX_ROWS"]
+        self.prune_every = app.config["AI_CACHE_PRUNE_EVERY"]
+        app.extensions["ai_cache"] = self
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _remember(self, key, items):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, items)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry[1]
+            if entry:
+                del self._entries[key]
+
+        if self.shared:
+            items = self._shared_get(key)
+            if items is not None:
+                self._remember(key, items)
+                self._count("shared_hits")
+                return items
+
+        self._count("misses")
+        return None
+
+    def set(self, key, items):
+        self._remember(key, items)
+        if self.shared:
+            self._shared_set(key, items)
+
+    def bypass(self):
+        self._count("bypassed")
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries))
+
+    def _shared_get(self, key):
+        from .models import AiSuggestionCache
+        row = db.session.get(AiSuggestionCache, key)
+        if row is None:
+            return None
+        if row.created_at < datetime.utcnow() - timedelta(seconds=self.ttl):
+            return None
+        return json.loads(row.items)
+
+    def _shared_set(self, key, items):
+        from .models import AiSuggestionCache
+        try:
+            db.session.merge(AiSuggestionCache(key=key, items=json.dumps(items), created_at=datetime.utcnow()))
+            db.session.commit()
+        except SQLAlchemyError:
+            # another worker stored the same key first; theirs is just as good
+            db.session.rollback()
+            return
+        with self._lock:
+            self._writes += 1
+            due = self.prune_every > 0 and self._writes % self.prune_every == 0
+        if due:
+            try:
+                self.prune()
+            except SQLAlchemyError:
+                # e.g. a concurrent prune holding the lock; the next one catches up
+                db.session.rollback()
+
+    def prune(self):
+        """
+        Delete expired rows from the shared table, then the oldest beyond
+        max_rows; returns the number removed.
+        """
+        from .models import AiSuggestionCache
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+        n = AiSuggestionCache.query.filter(AiSuggestionCache.created_at < cutoff).delete(synchronize_session=False)
+        overflow = (
+            select(AiSuggestionCache.key)
+            .order_by(AiSuggestionCache.created_at.desc())
+            .offset(self.max_rows)
+        )
+        n += AiSuggestionCache.query.filter(AiSuggestionCache.key.in_(overflow)).delete(synchronize_session=False)
+        db.session.commit()
+        return n
+
+
+suggestion_cache = SuggestionCache()
@@ -0,0 +1,94 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# Map-reduce extraction for long notes: split on speaker turns and paragraphs
+# into token-budgeted chunks, extract from every chunk concurrently, then merge
+# and de-duplicate the partial lists.
+
+SPEAKER = re.compile(r"^\s*[A-Z][\w .'-]{0,40}:\s", re.M)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s*")
+
+
+def estimate_tokens(text: str):
+    """
+    Rough token count (~4 characters per token for English), good enough for budgeting.
+    """
+    return len(text) // 4 + 1
+
+
+def _segments(notes: str):
+    for para in re.split(r"\n\s*\n", notes):
+        starts = [m.start() for m in SPEAKER.finditer(para)]
+        if not starts or starts[0] != 0:
+            starts.insert(0, 0)
+        for a, b in zip(starts, starts[1:] + [len(para)]):
+            seg = para[a:b].strip()
+            if seg:
+                yield seg
+
+
+def _split_oversized(seg: str, budget: int):
+    max_chars = budget * 4
+    piece = ""
+    for sentence in SENTENCE_END.split(seg):
+        while len(sentence) > max_chars:
+            if piece:
+                yield piece
+                piece = ""
+            yield sentence[:max_chars]
+            sentence = sentence[max_chars:]
+        if piece and estimate_tokens(piece + " " + sentence) > budget:
+            yield piece
+            piece = sentence
+        else:
+            piece = f"{piece} {sentence}" if piece else sentence
+    if piece:
+        yield piece
+
+
+def split_notes(notes: str, budget: int):
+    """
+    Pack speaker turns / paragraphs greedily into chunks of at most `budget` tokens.
+    """
+    chunks, current = [], ""
+    for seg in _segments(notes):
+        parts = _split_oversized(seg, budget) if estimate_tokens(seg) > budget else [seg]
+        for part in parts:
+            if current and estimate_tokens(current + "\n\n" + part) > budget:
+                chunks.append(current)
+                current = part
+            else:
+                current = f"{current}\n\n{part}" if current else part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _norm(item: str):
+    text = BULLET.sub("", item).lower()
+    return " ".join(re.findall(r"\w+", text))
+
+
+def merge_items(partials):
+    """
+    Concatenate per-chunk item lists in chunk order, dropping blanks and
+    items that repeat an earlier one once bullets, case and punctuation are ignored.
+    """
+    seen, merged = set(), []
+    for items in partials:
+        for item in items:
+            key = _norm(item)
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(item.strip())
+    return merged
+
+
+def map_reduce(notes: str, extract, budget: int, concurrency: int):
+    chunks = split_notes(notes, budget)
+    if len(chunks) == 1:
+        return extract(chunks[0])
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks)), thread_name_prefix="ai-chunk") as pool:
+        partials = list(pool.map(extract, chunks))
+    return merge_items(partials)
@@ -0,0 +1,33 @@
+import re
+import time
+from types import SimpleNamespace
+
+# Offline stand-in for the OpenAI client, selected with AI_PROVIDER=stub.
+# Mirrors the slice of the chat.completions API that app/ai.py uses and
+# answers deterministically, so the AI endpoints can be exercised and
+# benchmarked without network access.
+
+
+class _Completions:
+    def __init__(self, latency):
+        self.latency = latency
+
+    def create(self, model, messages, max_tokens=None, stream=False, **kwargs):
+        time.sleep(self.latency)
+        # the user prompt is "<header>:\n<notes>\n\n<instruction>"; keep only the notes
+        prompt = messages[-1]["content"]
+        notes = "\n\n".join(prompt.split("\n\n")[:-1]) or prompt
+        notes = notes.split("\n", 1)[-1]
+        sentences = [s.strip() for s in re.split(r"[.\n]+", notes) if len(s.strip()) > 3]
+        content = "\n".join(f"- {s}" for s in sentences[:5]) or "- Review the meeting notes"
+        if stream:
+            return (
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + 8]))])
+                for i in range(0, len(content), 8)
+            )
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class StubClient:
+    def __init__(self, latency=0.0):
+        self.chat = SimpleNamespace(completions=_Completions(latency))
@@ -1,11 +1,18 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from . import db, bcrypt
+from flask_jwt_extended import create_access_token, current_user, jwt_required
+from . import db
 from .models import User
+from .passwords import HasherBusy, password_hasher
+from .replica import note_write, replica_read
 from .req import require_json
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
+def _busy():
+    resp = jsonify({"error": "Busy", "message": "too many sign-ins in progress, retry shortly"})
+    resp.headers["Retry-After"] = "1"
+    return resp, 503
+
 @auth_bp.post("/register")
 def register():
     data = request.get_json() or {}
@@ -18,10 +25,14 @@ def register():
     if User.query.filter_by(email=email).first():
         return jsonify({"error": "email already registered"}), 409
 
-    pw_hash = bcrypt.generate_password_hash(password).decode("utf-8")
+    try:
+        pw_hash = password_hasher.hash(password)
+    except HasherBusy:
+        return _busy()
     user = User(email=email, password_hash=pw_hash)
     db.session.add(user)
     db.session.commit()
+    note_write(user.id)
 
     token = create_access_token(identity=str(user.id))
     return jsonify({"access_token": token}), 201
@@ -36,15 +47,27 @@ def login():
     password = data.get("password") or ""
 
     user = User.query.filter_by(email=email).first()
-    if not user or not bcrypt.check_password_hash(user.password_hash, password):
-        return jsonify({"error": "invalid credentials"}), 401
+    try:
+        if not user or not password_hasher.check(user.password_hash, password):
+            return jsonify({"error": "invalid credentials"}), 401
+    except HasherBusy:
+        return _busy()
+
+    # upgrade (or downgrade) the stored cost to BCRYPT_LOG_ROUNDS while we have the password;
+    # optional, so a full hashing pool skips it rather than refusing a correct password
+    if password_hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = password_hasher.hash(password)
+            db.session.commit()
+        except HasherBusy:
+            db.session.rollback()
 
     token = create_access_token(identity=str(user.id))
     return jsonify({"access_token": token}), 200
 
 @auth_bp.get("/me")
 @jwt_required()
+@replica_read
 def me():
-    uid = int(get_jwt_identity())
-    user = User.query.get_or_404(uid)
-    return jsonify({"id": user.id, "email": user.email}), 200
+    # resolved from the user cache by the JWT user loader (app/identity.py)
+    return jsonify({"id": current_user.id, "email": current_user.email}), 200
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required
+from . import db
+from .action_items import ITEM_COLUMNS, items_query
+from .etag import conditional
+from .identity import current_uid
+from .models import Meeting
+from .replica import replica_read
+from .serializers import columns_for, item_json, meeting_json, sparse
+from .validators import parse_date_range
+
+calendar_bp = Blueprint("calendar", __name__, url_prefix="/calendar")
+
+# One bounded window per request: the span is capped by CALENDAR_MAX_DAYS, so
+# both queries are range scans on ix_meeting_user_date / ix_action_item_user_due
+# and the result is returned whole instead of paginated.
+
+# calendar entries carry the meeting's summary fields only
+calendar_meeting_json = sparse(meeting_json, None, ("id", "title", "date", "attendees"))
+CALENDAR_MEETING_COLUMNS = columns_for(Meeting, calendar_meeting_json)
+
+
+def calendar_meetings_query(uid, start, end):
+    return (db.session.query(*CALENDAR_MEETING_COLUMNS)
+            .filter(Meeting.user_id == uid, Meeting.date >= start, Meeting.date <= end)
+            .order_by(Meeting.date, Meeting.id))
+
+
+@calendar_bp.get("")
+@jwt_required()
+@replica_read
+@conditional
+def get_calendar():
+    uid = current_uid()
+    status = request.args.get("status")
+    try:
+        start, end = parse_date_range(
+            request.args.get("from"), request.args.get("to"),
+            max_days=current_app.config["CALENDAR_MAX_DAYS"],
+        )
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+
+    meetings = calendar_meetings_query(uid, start, end)
+    items = items_query(uid, status, end, start, ITEM_COLUMNS)
+
+    days = defaultdict(lambda: {"meetings": [], "items": []})
+    for m in meetings:
+        days[m.date]["meetings"].append(calendar_meeting_json(m))
+    for it in items:
+        days[it.due_date]["items"].append(item_json(it))
+
+    return jsonify({
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "days": [{"date": d.isoformat(), **days[d]} for d in sorted(days)],
+    }), 200
@@ -0,0 +1,122 @@
+import click
+from datetime import date
+from flask import current_app
+from . import db
+
+
+def _explain(conn, query):
+    stmt = query.limit(10).statement
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    if conn.dialect.name == "sqlite":
+        params = tuple(compiled.params[k] for k in compiled.positiontup)
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), params).fetchall()
+        return [r[-1] for r in rows]
+    if conn.dialect.name == "postgresql":
+        # Tiny dev tables always favour a seq scan; disabling it asks "is there an index path at all?"
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        conn.exec_driver_sql("SET LOCAL enable_sort = off")
+        rows = conn.exec_driver_sql("EXPLAIN " + str(compiled), compiled.params).fetchall()
+        return [r[0] for r in rows]
+    raise click.ClickException(f"unsupported dialect: {conn.dialect.name}")
+
+
+def _bad_plan(dialect, lines):
+    for line in lines:
+        if dialect == "sqlite" and (line.startswith("SCAN ") or "TEMP B-TREE" in line):
+            return line
+        if dialect == "postgresql" and ("Seq Scan" in line or line.lstrip(" ->").startswith("Sort")):
+            return line
+    return None
+
+
+def list_query_cases():
+    from .meetings import meeting_items_query, meetings_query
+    from .action_items import items_query
+    from .calendar import calendar_meetings_query
+    from .stats import due_counts_query
+    from .sync import sync_queries
+
+    soon = date(2030, 1, 1)
+    sync_meetings, sync_items, sync_tombstones = sync_queries(1, 5)
+    return [
+        ("GET /meetings", meetings_query(1)),
+        ("GET /meetings/<id>/action-items", meeting_items_query(1)),
+        ("GET /action-items", items_query(1)),
+        ("GET /action-items?status=open", items_query(1, "open")),
+        ("GET /action-items?status=done", items_query(1, "done")),
+        ("GET /action-items?due_before=", items_query(1, None, soon)),
+        ("GET /action-items?status=open&due_before=", items_query(1, "open", soon)),
+        ("GET /meetings?from=&to=", meetings_query(1, None, date(2029, 12, 1), soon)),
+        ("GET /calendar (meetings)", calendar_meetings_query(1, date(2029, 12, 1), soon)),
+        ("GET /calendar (items)", items_query(1, None, soon, date(2029, 12, 1))),
+        ("GET /calendar?status=open (items)", items_query(1, "open", soon, date(2029, 12, 1))),
+        ("GET /stats (open items due)", due_counts_query(1, date(2029, 12, 1), soon, only_open_due=True)),
+        ("GET /sync?since= (meetings)", sync_meetings),
+        ("GET /sync?since= (items)", sync_items),
+        ("GET /sync?since= (tombstones)", sync_tombstones),
+    ]
+
+
+def register_commands(app):
+
+    @app.cli.command("check-query-plans")
+    def check_query_plans():
+        """EXPLAIN the list endpoint queries; fail on a full scan or a sort step."""
+        failures = 0
+        with db.engine.connect() as conn:
+            for name, query in list_query_cases():
+                with conn.begin():
+                    lines = _explain(conn, query)
+                bad = _bad_plan(conn.dialect.name, lines)
+                status = "FAIL" if bad else "ok"
+                click.echo(f"[{status}] {name}")
+                for line in lines:
+                    click.echo(f"    {line}")
+                failures += bool(bad)
+        if failures:
+            raise click.ClickException(f"{failures} list quer{'y' if failures == 1 else 'ies'} not index-backed")
+
+    @app.cli.command("rebuild-stats")
+    def rebuild_stats():
+        """Recompute the per-user summary counters behind GET /stats."""
+        from .stats import rebuild_summaries
+        rebuild_summaries()
+        click.echo("stats summaries rebuilt")
+
+    @app.cli.command("prune-tombstones")
+    @click.option("--days", type=int, default=None, help="Keep this many days (SYNC_TOMBSTONE_DAYS).")
+    def prune_tombstones_cmd(days):
+        """Delete GET /sync tombstones past the retention window."""
+        from .sync import prune_tombstones
+        n = prune_tombstones(days if days is not None else current_app.config["SYNC_TOMBSTONE_DAYS"])
+        click.echo(f"{n} tombstones pruned")
+
+    @app.cli.command("prune-ai-cache")
+    def prune_ai_cache_cmd():
+        """Delete expired /ai/suggest cache rows and cap the table at AI_CACHE_MAX_ROWS."""
+        from .ai_cache import suggestion_cache
+        n = suggestion_cache.prune()
+        click.echo(f"{n} cached suggestions pruned")
+
+    @app.cli.command("import-meetings")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--user", "email", required=True, help="Email of the account to import into.")
+    @click.option("--format", "fmt", type=click.Choice(["ndjson", "csv"]), help="Defaults to the file extension.")
+    @click.option("--batch-size", type=int, default=None, help="Meetings per transaction (IMPORT_BATCH_SIZE).")
+    def import_meetings(path, email, fmt, batch_size):
+        """Bulk-import meetings with nested action items from NDJSON or CSV."""
+        from .importer import import_rows
+        from .models import User
+
+        user = User.query.filter_by(email=email.strip().lower()).first()
+        if not user:
+            raise click.ClickException(f"no user with email {email}")
+        fmt = fmt or ("csv" if path.lower().endswith(".csv") else "ndjson")
+        with open(path, encoding="utf-8", errors="surrogateescape", newline="" if fmt == "csv" else None) as fh:
+            report = import_rows(user.id, fh, fmt, batch_size or current_app.config["IMPORT_BATCH_SIZE"])
+        for err in report["errors"]:
+            click.echo(f"row {err['row']}: {err['message']}", err=True)
+        click.echo(
+            f"{report['meetings']} meetings, {report['items']} items imported from {report['rows']} rows "
+            f"({len(report['errors'])} rejected) in {report['seconds']}s — {report['rows_per_sec']} rows/s"
+        )
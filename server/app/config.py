@@ -7,4 +7,137 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///dev.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "jwt_secret")
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
\ No newline at end of file
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    # default /ai/suggest engine: "llm", "local" (rule based, offline) or "auto" (llm, local on failure)
+    AI_EXTRACTOR = os.getenv("AI_EXTRACTOR", "llm")
+    # send only the lines the local engine flags as actions to the LLM
+    AI_PREFILTER = os.getenv("AI_PREFILTER", "0").lower() in {"1", "true", "yes"}
+    AI_TIMEOUT = float(os.getenv("AI_TIMEOUT", "30"))
+    # streaming has no response-size wall to hide behind, so it gets a larger budget
+    AI_STREAM_MAX_TOKENS = int(os.getenv("AI_STREAM_MAX_TOKENS", "1024"))
+    # "openai" or "stub" (offline, deterministic; see app/ai_stub.py)
+    AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")
+    AI_STUB_LATENCY = float(os.getenv("AI_STUB_LATENCY", "0"))
+    # notes longer than this (estimated tokens) are split and extracted chunk by chunk
+    AI_CHUNK_TOKENS = int(os.getenv("AI_CHUNK_TOKENS", "1500"))
+    AI_CHUNK_CONCURRENCY = int(os.getenv("AI_CHUNK_CONCURRENCY", "4"))
+
+    # /ai/suggest result cache: "memory" (per process) or "db" (shared through the app database)
+    AI_CACHE_BACKEND = os.getenv("AI_CACHE_BACKEND", "memory")
+    AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", "86400"))
+    AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "1024"))
+    # "db" backend: row cap for the shared table; expired and oldest rows are pruned every AI_CACHE_PRUNE_EVERY writes
+    AI_CACHE_MAX_ROWS = int(os.getenv("AI_CACHE_MAX_ROWS", "100000"))
+    AI_CACHE_PRUNE_EVERY = int(os.getenv("AI_CACHE_PRUNE_EVERY", "100"))
+
+    # async /ai/suggest jobs
+    AI_JOB_CONCURRENCY = int(os.getenv("AI_JOB_CONCURRENCY", "4"))
+    AI_JOB_MAX_PENDING = int(os.getenv("AI_JOB_MAX_PENDING", "100"))
+    AI_JOB_STALE_AFTER = int(os.getenv("AI_JOB_STALE_AFTER", "300"))
+
+    # keep per-user counters for GET /stats (run `flask rebuild-stats` after enabling)
+    STATS_SUMMARY = os.getenv("STATS_SUMMARY", "0").lower() in {"1", "true", "yes"}
+
+    # widest window GET /calendar will return unpaginated
+    CALENDAR_MAX_DAYS = int(os.getenv("CALENDAR_MAX_DAYS", "62"))
+
+    # optional read replica for GET endpoints (app/replica.py); a second SQLite
+    # file works for local testing
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+    SQLALCHEMY_BINDS = {"replica": DATABASE_REPLICA_URL} if DATABASE_REPLICA_URL else {}
+    # after a write, that user's reads stay on the primary for this long
+    REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
+    # PRAGMAs run on every new SQLite connection (app/sqlite_pragmas.py)
+    SQLITE_PRAGMAS = {"foreign_keys": "ON"}
+
+    # GET /sync tombstones are pruned after this many days (`flask prune-tombstones`);
+    # older sync tokens get a full snapshot instead of a delta
+    SYNC_TOMBSTONE_DAYS = int(os.getenv("SYNC_TOMBSTONE_DAYS", "30"))
+
+    # rows fetched per round trip by GET /export
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+    # meetings per transaction for POST /import and `flask import-meetings`
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+
+    # bcrypt cost for new hashes; a login rehashes stored passwords made with another cost
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    # bcrypt runs on its own pool of this many threads (app/passwords.py); at most
+    # PASSWORD_HASH_MAX_PENDING more requests wait, the rest get 503
+    PASSWORD_HASH_CONCURRENCY = int(os.getenv("PASSWORD_HASH_CONCURRENCY", "2"))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+
+    # per-process cache of the user record behind every JWT (app/identity.py); 0 = off
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+
+    # jsonify() encoder: "auto" (orjson when installed), "orjson" or "std" (app/serializers.py)
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
+
+    # request instrumentation (app/metrics.py); all off by default
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0").lower() in {"1", "true", "yes"}
+    # if set, GET /metrics requires "Authorization: Bearer <token>"
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+    SERVER_TIMING = os.getenv("SERVER_TIMING", "0").lower() in {"1", "true", "yes"}
+    # log SQL statements slower than this many milliseconds (0 = off)
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "0"))
+
+
+# Deployment profiles, picked with APP_PROFILE (default "dev"). They only
+# tune the database engine; everything else comes from Config / env vars.
+
+class DevConfig(Config):
+    # default pool, SQLite in rollback-journal mode (no -wal/-shm files next to dev.db)
+    pass
+
+
+class ProdSqliteConfig(Config):
+    # WAL lets readers run alongside the single writer; NORMAL is durable
+    # across app crashes in WAL mode (only an OS crash can lose the last commit).
+    SQLITE_PRAGMAS = {
+        "foreign_keys": "ON",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000")),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    }
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "8")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "8")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+    }
+
+
+class ProdPostgresConfig(Config):
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        # drop connections the server or a proxy closed while idle
+        "pool_pre_ping": True,
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "connect_args": {
+            "connect_timeout": int(os.getenv("DB_CONNECT_TIMEOUT", "5")),
+            "options": (
+                f"-c statement_timeout={int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '15000'))}"
+                f" -c idle_in_transaction_session_timeout={int(os.getenv('DB_IDLE_TX_TIMEOUT_MS', '60000'))}"
+            ),
+        },
+    }
+
+
+PROFILES = {
+    "dev": DevConfig,
+    "prod-sqlite": ProdSqliteConfig,
+    "prod-postgres": ProdPostgresConfig,
+}
+
+
+def config_for(profile):
+    """
+    Return the config class for a profile name; raises ValueError for unknown names.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"APP_PROFILE must be one of {sorted(PROFILES)}")
+    return PROFILES[profile]
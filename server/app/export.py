@@ -0,0 +1,80 @@
+import csv
+import io
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from flask_jwt_extended import jwt_required
+from .action_items import ITEM_COLUMNS, item_filters, items_query
+from .identity import current_uid
+from .meetings import MEETING_COLUMNS, meetings_query
+from .replica import replica_read
+from .serializers import item_json, meeting_json
+from .validators import parse_date_range
+
+export_bp = Blueprint("export", __name__, url_prefix="/export")
+
+# Rows are fetched EXPORT_BATCH_SIZE at a time (yield_per, which also turns on
+# server-side cursors on PostgreSQL) and written out as soon as they are read,
+# so memory stays flat however many rows an account has.
+
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+COLUMNS = {
+    "meetings": ["id", "title", "date", "attendees", "notes", "created_at"],
+    "items": ["id", "meeting_id", "title", "due_date", "status", "assignee", "created_at"],
+}
+
+
+def _ndjson_lines(rows, to_json):
+    dumps = current_app.json.dumps
+    for row in rows:
+        yield dumps(to_json(row)) + "\n"
+
+
+def _csv_lines(rows, to_json, columns):
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(to_json(row))
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    yield buf.getvalue()
+
+
+@export_bp.get("")
+@jwt_required()
+@replica_read
+def export_rows():
+    uid = current_uid()
+    fmt = request.args.get("format", "ndjson")
+    kind = request.args.get("kind", "meetings")
+    if fmt not in FORMATS:
+        return jsonify({"error": "ValidationError", "message": f"format must be one of {sorted(FORMATS)}"}), 400
+    if kind not in COLUMNS:
+        return jsonify({"error": "ValidationError", "message": f"kind must be one of {sorted(COLUMNS)}"}), 400
+
+    # same filters as GET /meetings and GET /action-items
+    try:
+        if kind == "meetings":
+            q = (request.args.get("q") or "").strip()
+            start, end = parse_date_range(request.args.get("from"), request.args.get("to"))
+            query, to_json = meetings_query(uid, q, start, end, MEETING_COLUMNS), meeting_json
+        else:
+            query, to_json = items_query(uid, *item_filters(request.args), ITEM_COLUMNS), item_json
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+
+    rows = query.yield_per(current_app.config["EXPORT_BATCH_SIZE"])
+    if fmt == "csv":
+        lines = _csv_lines(rows, to_json, COLUMNS[kind])
+    else:
+        lines = _ndjson_lines(rows, to_json)
+
+    return Response(
+        stream_with_context(lines),
+        mimetype=FORMATS[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{kind}.{fmt}"',
+            "Cache-Control": "no-store",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,236 @@
+import calendar
+import re
+from datetime import date, timedelta
+
+# Pluggable action-item extractors. An extractor turns meeting notes into
+# candidates shaped like ActionItem fields: {"title", "assignee", "due_date"}.
+# The built-in "local" engine is rule based: no network, deterministic, and
+# cheap enough to run on every request (pre-compiled patterns, one pass per
+# sentence).
+
+VERBS = frozenset("""
+    add arrange ask book build call check circulate clean compile confirm contact coordinate
+    create decide deliver deploy design document draft email escalate estimate file finalize
+    finish fix follow gather get implement investigate invite look merge migrate move notify
+    order organize organise plan post prepare present prioritize publish push reach record
+    refactor remind reply report research reschedule resolve respond review revise run
+    schedule send set share ship sign start submit summarize sync talk test track update
+    upload verify write
+""".split())
+
+# words that follow "X will" without making it an action ("Ann will be out")
+NOT_ACTIONS = frozenset("be not probably also likely still have already never".split())
+SELF = frozenset({"i", "we"})
+
+SPEAKER = re.compile(r"^\s*(?P<speaker>[A-Z][\w.'-]*(?: [A-Z][\w.'-]*)?)\s*:\s+(?P<text>.+)$")
+SENTENCE_END = re.compile(r"(?<=[.!?;])\s+")
+BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)]|\[[ x]\])\s*", re.I)
+CUE = re.compile(r"^(?:todo|to-do|action(?: item)?|ai|follow[- ]up|next step)\s*[:\-]\s*(?P<rest>.+)$", re.I)
+WILL = re.compile(
+    r"^(?P<who>[A-Z][a-z]+(?: [A-Z][a-z]+)?|I|we|We)\s+"
+    r"(?P<modal>will|'ll|is going to|are going to|am going to|needs to|need to|should|must|has to|have to|to)\s+"
+    r"(?P<rest>.+)$"
+)
+LETS = re.compile(r"^(?:let's|let us|we need to|need to|please)\s+(?P<rest>.+)$", re.I)
+MENTION = re.compile(r"@(?P<who>[\w.-]+)")
+WORD = re.compile(r"\w+")
+WEEKDAYS = {name[:3].lower(): i for i, name in enumerate(calendar.day_name)}
+MONTHS = {name[:3].lower(): i for i, name in enumerate(calendar.month_name) if name}
+DUE = re.compile(
+    r"\s*\b(?:by|due(?: on| by)?|before|until|no later than)\s+(?:the\s+)?(?P<when>"
+    r"today|tonight|tomorrow|eod|eow|end of (?:the )?(?:day|week|month)|next week"
+    r"|(?:next\s+)?(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*"
+    r"|\d{4}-\d{2}-\d{2}"
+    r"|(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2}(?:st|nd|rd|th)?"
+    r"|\d{1,2}/\d{1,2}"
+    r")\b",
+    re.I,
+)
+# unambiguous deadlines that need no "by"/"due" in front
+BARE_DUE = re.compile(r"\s*\b(?P<when>eod|eow|tomorrow|next week|end of (?:the )?(?:day|week|month))\b", re.I)
+
+
+def resolve_due(when: str, today: date):
+    """
+    Resolve a due-date phrase relative to `today`; returns a date or None.
+    """
+    w = when.lower().strip()
+    if w in {"today", "tonight", "eod", "end of day", "end of the day"}:
+        return today
+    if w == "tomorrow":
+        return today + timedelta(days=1)
+    if w in {"eow", "end of week", "end of the week"}:
+        return today + timedelta(days=(4 - today.weekday()) % 7)
+    if w in {"end of month", "end of the month"}:
+        return today.replace(day=calendar.monthrange(today.year, today.month)[1])
+    if w == "next week":
+        return today + timedelta(days=7 - today.weekday())
+    if w.startswith("next ") and w[5:8] in WEEKDAYS:
+        # "next friday" is the friday of next calendar week
+        return today + timedelta(days=7 - today.weekday() + WEEKDAYS[w[5:8]])
+    if w[:3] in WEEKDAYS and w.isalpha():
+        return today + timedelta(days=(WEEKDAYS[w[:3]] - today.weekday()) % 7 or 7)
+    try:
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", w):
+            return date.fromisoformat(w)
+        m = re.fullmatch(r"([a-z]{3})[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?", w)
+        if m and m.group(1) in MONTHS:
+            d = date(today.year, MONTHS[m.group(1)], int(m.group(2)))
+            return d if d >= today else d.replace(year=today.year + 1)
+        m = re.fullmatch(r"(\d{1,2})/(\d{1,2})", w)
+        if m:
+            d = date(today.year, int(m.group(1)), int(m.group(2)))
+            return d if d >= today else d.replace(year=today.year + 1)
+    except ValueError:
+        return None
+    return None
+
+
+def _first_word(text: str):
+    # lowercased, without trailing punctuation ("test." -> "test")
+    m = WORD.match(text)
+    return m.group(0).lower() if m else ""
+
+
+def _title(text: str):
+    text = text.strip().rstrip(".!;,").strip()
+    return (text[:1].upper() + text[1:])[:200] if text else ""
+
+
+def parse_action(sentence: str, today: date, speaker=None, require_cue=True):
+    """
+    Parse one sentence into a candidate dict, or None when it carries no
+    action cue. With require_cue=False any non-empty sentence is accepted
+    (used to pull fields out of LLM bullets).
+    """
+    text = BULLET.sub("", sentence).strip()
+    if not text:
+        return None
+
+    assignee, rest = None, None
+    m = CUE.match(text)
+    if m:
+        rest = m.group("rest")
+    if rest is None:
+        m = WILL.match(text)
+        if m:
+            first = _first_word(m.group("rest"))
+            if m.group("modal") == "to" and first not in VERBS:
+                m = None
+            elif first in NOT_ACTIONS:
+                m = None
+        if m:
+            who = m.group("who")
+            assignee = speaker if who.lower() in SELF else who
+            rest = m.group("rest")
+    if rest is None:
+        m = LETS.match(text)
+        if m:
+            rest = m.group("rest")
+    if rest is None and _first_word(text) in VERBS:
+        rest = text
+    if rest is None:
+        if require_cue:
+            return None
+        rest = text
+    if not require_cue and not assignee:
+        assignee = speaker
+
+    mention = MENTION.search(rest)
+    if mention and not assignee:
+        assignee = mention.group("who")
+        if mention.start() == 0:
+            rest = rest[mention.end():]
+
+    due_date = None
+    m = DUE.search(rest) or BARE_DUE.search(rest)
+    if m:
+        due_date = resolve_due(m.group("when"), today)
+        if due_date:
+            rest = rest[:m.start()] + rest[m.end():]
+
+    title = _title(rest)
+    if not title:
+        return None
+    return {
+        "title": title,
+        "assignee": assignee[:120] if assignee else None,
+        "due_date": due_date.isoformat() if due_date else None,
+    }
+
+
+def _sentences(notes: str):
+    for line in notes.splitlines():
+        speaker = None
+        m = SPEAKER.match(line)
+        if m and not CUE.match(line.strip()):
+            speaker, line = m.group("speaker"), m.group("text")
+        for sentence in SENTENCE_END.split(line):
+            if sentence.strip():
+                yield speaker, sentence
+
+
+class Extractor:
+    name = "base"
+
+    def extract(self, notes: str, today=None):
+        raise NotImplementedError
+
+
+class LocalExtractor(Extractor):
+    name = "local"
+
+    def extract(self, notes: str, today=None):
+        today = today or date.today()
+        seen, out = set(), []
+        for speaker, sentence in _sentences(notes):
+            cand = parse_action(sentence, today, speaker)
+            if cand and cand["title"].lower() not in seen:
+                seen.add(cand["title"].lower())
+                out.append(cand)
+        return out
+
+    def prefilter(self, notes: str):
+        """
+        Keep only the lines that carry an action cue, to shrink an LLM prompt.
+        """
+        today = date.today()
+        keep = [
+            line for line in notes.splitlines()
+            if any(parse_action(s, today, sp) for sp, s in _sentences(line))
+        ]
+        return "\n".join(keep)
+
+
+_registry = {"local": LocalExtractor}
+
+
+def register_extractor(cls):
+    _registry[cls.name] = cls
+    return cls
+
+
+def get_extractor(name: str):
+    """
+    Return an extractor instance by name; raises ValueError for unknown engines.
+    """
+    if name not in _registry:
+        raise ValueError(f"engine must be one of {sorted(set(_registry) | {'auto', 'llm'})}")
+    return _registry[name]()
+
+
+def to_candidates(items, today=None):
+    """
+    Map free-text suggestions (e.g. LLM bullets) onto ActionItem-shaped candidates.
+    """
+    today = today or date.today()
+    out = []
+    for item in items:
+        text, speaker = BULLET.sub("", item), None
+        m = SPEAKER.match(text)
+        if m and not CUE.match(text):
+            speaker, text = m.group("speaker"), m.group("text")
+        cand = parse_action(text, today, speaker, require_cue=False)
+        if cand:
+            out.append(cand)
+    return out
@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from flask import current_app, g
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import event
+from . import db, jwt
+from .models import User
+
+# Who is calling. current_uid() parses the JWT identity once per request;
+# Flask-JWT-Extended resolves the user record through user_cache (wired in as
+# its user_lookup_loader), so `current_user` is available on every protected
+# route and a token for a user that no longer exists is rejected with 401.
+#
+# The cache holds a small immutable snapshot per user (never a session-bound
+# ORM object) for USER_CACHE_TTL seconds, per process. ORM updates and deletes
+# of a User invalidate its entry here; anything else that changes a user row
+# (a Core UPDATE, raw SQL) calls user_cache.invalidate(uid). Other workers pick
+# the change up when their entry expires. USER_CACHE_TTL=0 turns the cache off.
+
+CachedUser = namedtuple("CachedUser", ["id", "email", "created_at"])
+
+
+def current_uid():
+    """
+    The signed-in user's id, parsed once per request (use under @jwt_required()).
+    """
+    uid = g.get("uid")
+    if uid is None:
+        uid = g.uid = int(get_jwt_identity())
+    return uid
+
+
+def owned(model, object_id):
+    """
+    The current user's `model` row with this id, or None (missing or not theirs).
+    """
+    return model.query.filter_by(id=object_id, user_id=current_uid()).first()
+
+
+class UserCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.ttl = 60
+        self.max_entries = 10000
+        self.stats = {"hits": 0, "misses": 0}
+
+    def init_app(self, app):
+        self.ttl = app.config["USER_CACHE_TTL"]
+        self.max_entries = app.config["USER_CACHE_MAX_ENTRIES"]
+        app.extensions["user_cache"] = self
+
+    def get(self, uid):
+        """
+        The user's snapshot, or None if there is no such user (misses are not cached).
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(uid)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(uid)
+                self.stats["hits"] += 1
+                return entry[1]
+            self.stats["misses"] += 1
+
+        row = db.session.query(User.id, User.email, User.created_at).filter(User.id == uid).first()
+        if row is None:
+            return None
+        user = CachedUser(*row)
+        if self.ttl > 0:
+            with self._lock:
+                self._entries[uid] = (now + self.ttl, user)
+                self._entries.move_to_end(uid)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return user
+
+    def invalidate(self, uid):
+        with self._lock:
+            self._entries.pop(uid, None)
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(_mapper, _connection, user):
+    user_cache.invalidate(user.id)
+
+
+@jwt.user_lookup_loader
+def _load_user(_jwt_header, jwt_data):
+    try:
+        uid = int(jwt_data[current_app.config["JWT_IDENTITY_CLAIM"]])
+    except (KeyError, TypeError, ValueError):
+        return None
+    g.uid = uid
+    return user_cache.get(uid)
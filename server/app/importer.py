@@ -0,0 +1,201 @@
+import csv
+import io
+import json
+import time
+from collections import Counter
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from . import db
+from .action_items import item_fields
+from .etag import bump_data_version
+from .identity import current_uid
+from .models import ActionItem, Meeting
+from .stats import record_items, record_meetings
+from .validators import ensure_nonempty, ensure_optional_str, parse_iso_date
+
+import_bp = Blueprint("import", __name__, url_prefix="/import")
+
+# Bulk import of historical meetings with nested action items. Input is read
+# one row at a time (NDJSON line or CSV record), validated with the same rules
+# as POST /meetings and POST /action-items, and written IMPORT_BATCH_SIZE
+# meetings per transaction: one INSERT ... RETURNING for the meetings, one bulk
+# INSERT for their items. An invalid row is reported and skipped; it does not
+# fail the rest of its batch. If the database still rejects a batch, its rows
+# are retried one per transaction so only the offending row is reported.
+# Records that cannot be read (not UTF-8, malformed CSV) are reported the same
+# way, so a bad record never turns into an error response after earlier
+# batches have been committed: the caller always gets the report.
+
+FORMATS = {"ndjson", "csv"}
+
+# notes can be long; the csv module's default cap is 128 KiB per field
+csv.field_size_limit(16 * 1024 * 1024)
+
+
+def _utf8(*values):
+    """
+    False if any string came from invalid UTF-8 (streams are opened with
+    errors="surrogateescape", which keeps undecodable bytes as surrogates).
+    """
+    try:
+        for v in values:
+            if isinstance(v, str):
+                v.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _read_ndjson(stream):
+    for line in stream:
+        if line.strip():
+            if not _utf8(line):
+                yield None, "invalid UTF-8"
+                continue
+            try:
+                yield json.loads(line), None
+            except ValueError as ex:
+                yield None, f"invalid JSON: {ex}"
+
+
+def _read_csv(stream):
+    # columns: title, date, attendees, notes, action_items (a JSON array)
+    reader = csv.DictReader(stream)
+    while True:
+        try:
+            rec = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as ex:
+            yield None, f"invalid CSV record: {ex}"
+            continue
+        if not _utf8(*rec.values()):
+            yield None, "invalid UTF-8"
+            continue
+        items = rec.get("action_items")
+        try:
+            rec["action_items"] = json.loads(items) if items else []
+        except ValueError as ex:
+            yield None, f"action_items: invalid JSON: {ex}"
+            continue
+        yield rec, None
+
+
+def parse_row(data):
+    """
+    Validate one import row; returns (meeting columns, [item columns]) or
+    raises ValueError.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("row must be an object")
+    try:
+        meeting = {
+            "title": ensure_nonempty(data.get("title"), "title"),
+            "date": parse_iso_date(ensure_nonempty(data.get("date"), "date")),
+            "attendees": ensure_optional_str(data.get("attendees"), "attendees") or None,
+            "notes": ensure_optional_str(data.get("notes"), "notes") or None,
+        }
+        items = data.get("action_items") or []
+        if not isinstance(items, list) or not all(isinstance(it, dict) for it in items):
+            raise ValueError("action_items must be a list of objects")
+        rows = []
+        for i, it in enumerate(items):
+            try:
+                rows.append(item_fields(it, partial=False))
+            except ValueError as ex:
+                raise ValueError(f"action_items[{i}]: {ex}")
+    except (TypeError, AttributeError):
+        raise ValueError("title, date and item fields must be strings")
+    return meeting, rows
+
+
+def _flush(uid, batch, report):
+    """
+    Insert one batch of parsed rows in a single transaction.
+    """
+    version = bump_data_version(uid)
+    meeting_ids = db.session.scalars(
+        insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True),
+        [dict(meeting, user_id=uid, sync_version=version) for _, meeting, _ in batch],
+    ).all()
+    item_rows = [
+        dict(it, meeting_id=mid, user_id=uid, sync_version=version)
+        for (_, _, items), mid in zip(batch, meeting_ids)
+        for it in items
+    ]
+    if item_rows:
+        db.session.execute(insert(ActionItem), item_rows)
+
+    record_meetings(uid, Counter(meeting["date"] for _, meeting, _ in batch))
+    record_items(uid, Counter(it["status"] for it in item_rows))
+    db.session.commit()
+    report["meetings"] += len(batch)
+    report["items"] += len(item_rows)
+
+
+def import_rows(uid, stream, fmt, batch_size):
+    """
+    Import meetings from a text stream of NDJSON or CSV for user `uid`.
+    Returns a report: counts, per-row errors and throughput in rows/second.
+    """
+    started = time.perf_counter()
+    report = {"rows": 0, "meetings": 0, "items": 0, "errors": []}
+    reader = _read_csv(stream) if fmt == "csv" else _read_ndjson(stream)
+
+    def flush(batch):
+        try:
+            _flush(uid, batch, report)
+        except SQLAlchemyError as ex:
+            db.session.rollback()
+            if len(batch) == 1:
+                report["errors"].append({"row": batch[0][0], "message": f"database error: {ex.__class__.__name__}"})
+                return
+            for row in batch:
+                flush([row])
+
+    batch = []
+    for data, error in reader:
+        report["rows"] += 1
+        n = report["rows"]
+        if error is None:
+            try:
+                meeting, items = parse_row(data)
+            except ValueError as ex:
+                error = str(ex)
+        if error is not None:
+            report["errors"].append({"row": n, "message": error})
+            continue
+        batch.append((n, meeting, items))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    if batch:
+        flush(batch)
+    report["errors"].sort(key=lambda e: e["row"])
+
+    elapsed = time.perf_counter() - started
+    report["seconds"] = round(elapsed, 3)
+    report["rows_per_sec"] = round(report["rows"] / elapsed, 1) if elapsed else None
+    return report
+
+
+@import_bp.post("")
+@jwt_required()
+def import_meetings():
+    uid = current_uid()
+    fmt = request.args.get("format") or ("csv" if request.mimetype == "text/csv" else "ndjson")
+    if fmt not in FORMATS:
+        return jsonify({"error": "ValidationError", "message": f"format must be one of {sorted(FORMATS)}"}), 400
+    try:
+        batch_size = int(request.args.get("batch_size") or current_app.config["IMPORT_BATCH_SIZE"])
+        if batch_size < 1:
+            raise ValueError
+    except ValueError:
+        return jsonify({"error": "ValidationError", "message": "batch_size must be a positive integer"}), 400
+
+    stream = io.TextIOWrapper(
+        request.stream, encoding="utf-8", errors="surrogateescape", newline="" if fmt == "csv" else None
+    )
+    return jsonify(import_rows(uid, stream, fmt, batch_size)), 200
@@ -0,0 +1,112 @@
+import json
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from . import db
+from .models import AiJob
+
+ACTIVE = ("queued", "running")
+
+
+class QueueFull(Exception):
+    pass
+
+
+class JobQueue:
+    """
+    Bounded thread pool for AI extraction jobs. Job state lives in the
+    `ai_job` table, so results survive a restart. Jobs for identical notes
+    (same cache key) share one in-flight run: the worker finishes every
+    active job row with that key in a single UPDATE.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._executor = None
+        self._app = None
+        self.max_pending = 100
+        self.stale_after = 300
+
+    def init_app(self, app):
+        self._app = app
+        self.max_pending = app.config["AI_JOB_MAX_PENDING"]
+        self.stale_after = app.config["AI_JOB_STALE_AFTER"]
+        self._executor = ThreadPoolExecutor(
+            max_workers=app.config["AI_JOB_CONCURRENCY"], thread_name_prefix="ai-job"
+        )
+        app.extensions["ai_jobs"] = self
+
+    def enqueue(self, uid, key, notes, work):
+        """
+        Return the user's active job for `key`, or create one and schedule
+        `work(notes)`. Raises QueueFull when too many distinct runs are pending.
+        """
+        job = AiJob.query.filter(AiJob.user_id == uid, AiJob.key == key, AiJob.status.in_(ACTIVE)).first()
+        if job:
+            return job
+
+        with self._lock:
+            if key not in self._inflight and len(self._inflight) >= self.max_pending:
+                raise QueueFull()
+
+        job = AiJob(id=uuid.uuid4().hex, user_id=uid, key=key, notes=notes, status="queued")
+        db.session.add(job)
+        db.session.commit()
+        self._start(key, notes, work)
+        return job
+
+    def recover(self, job, work):
+        """
+        Reschedule an active job nobody is working on, e.g. after a restart.
+        """
+        if job.status not in ACTIVE:
+            return
+        with self._lock:
+            if job.key in self._inflight:
+                return
+        since = job.started_at or job.created_at
+        if since < datetime.utcnow() - timedelta(seconds=self.stale_after):
+            self._start(job.key, job.notes, work)
+
+    def _start(self, key, notes, work):
+        with self._lock:
+            if key not in self._inflight:
+                self._inflight[key] = self._executor.submit(self._run, key, notes, work)
+
+    def _finish(self, key, **values):
+        AiJob.query.filter(AiJob.key == key, AiJob.status.in_(ACTIVE)).update(
+            dict(values, finished_at=datetime.utcnow()), synchronize_session=False
+        )
+        db.session.commit()
+
+    def _run(self, key, notes, work):
+        with self._app.app_context():
+            try:
+                AiJob.query.filter(AiJob.key == key, AiJob.status == "queued").update(
+                    {"status": "running", "started_at": datetime.utcnow()}, synchronize_session=False
+                )
+                db.session.commit()
+                try:
+                    items = work(notes)
+                except Exception as e:
+                    self._release(key)
+                    self._finish(key, status="error", error=str(e))
+                else:
+                    # release before the final UPDATE so a job row committed after
+                    # it is picked up by a fresh run instead of being stranded
+                    self._release(key)
+                    self._finish(key, status="done", items=json.dumps(items))
+            except Exception:
+                self._release(key)
+                self._app.logger.exception("AI job %s failed to record its result", key)
+            finally:
+                db.session.remove()
+
+    def _release(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+
+job_queue = JobQueue()
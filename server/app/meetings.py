@@ -1,52 +1,72 @@
 from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import or_
+from flask_jwt_extended import jwt_required
+from sqlalchemy import delete
 from . import db
-from .models import Meeting
+from .action_items import ITEM_COLUMNS, ITEM_SORT
+from .identity import current_uid, owned
+from .models import ActionItem, Meeting
+from .etag import bump_data_version, conditional, record_deletes
+from .pagination import SortKey, paginate, sort_clauses
+from .replica import replica_read
 from .req import require_json
-from .validators import parse_iso_date, ensure_nonempty  
+from .search import search_meetings
+from .serializers import columns_for, item_json, meeting_json, sparse
+from .stats import forget_meetings, record_meetings
+from .validators import parse_date_range, parse_iso_date, ensure_nonempty  
 
 meetings_bp = Blueprint("meetings", __name__, url_prefix="/meetings")
 
-def _paginate(q):
-    page = request.args.get("page", 1, type=int)
-    per_page = request.args.get("per_page", 10, type=int)
-    per_page = max(1, min(per_page, 50))
-    return q.paginate(page=page, per_page=per_page, error_out=False)
+MEETING_SORT = [
+    SortKey(Meeting.date, True, lambda m: m.date),
+    SortKey(Meeting.id, True, lambda m: m.id),
+]
+
+MEETING_COLUMNS = columns_for(Meeting, meeting_json)
+# list pages leave out the (unbounded) notes unless ?fields= asks for them
+MEETING_LIST_FIELDS = tuple(f for f in meeting_json.fields if f != "notes")
+
+def meetings_query(uid, q=None, date_from=None, date_to=None, columns=None):
+    """
+    The user's meetings, filtered and ordered like GET /meetings. With
+    `columns`, rows are just those columns (plus `snippet` when searching).
+    """
+    if q:
+        query = search_meetings(uid, q, columns)
+    else:
+        query = (db.session.query(*columns) if columns else Meeting.query).filter(Meeting.user_id == uid)
+    if date_from:
+        query = query.filter(Meeting.date >= date_from)
+    if date_to:
+        query = query.filter(Meeting.date <= date_to)
+    return query if q else query.order_by(*sort_clauses(MEETING_SORT))
 
 @meetings_bp.get("")
 @jwt_required()
+@replica_read
+@conditional
 def list_meetings():
-    uid = int(get_jwt_identity())
+    uid = current_uid()
     q = (request.args.get("q") or "").strip()
-    query = Meeting.query.filter_by(user_id=uid)
+    try:
+        dump = sparse(meeting_json, request.args.get("fields"), MEETING_LIST_FIELDS)
+        start, end = parse_date_range(request.args.get("from"), request.args.get("to"))
+        columns = columns_for(Meeting, dump, [Meeting.date, Meeting.id])
+        # search results are ranked, so they only support page mode
+        rows, meta = paginate(meetings_query(uid, q, start, end, columns), None if q else MEETING_SORT)
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
 
+    items = [dump(m) for m in rows]
     if q:
-        like = f"%{q}%"
-        query = query.filter(or_(Meeting.title.ilike(like), Meeting.attendees.ilike(like)))
-
-    query = query.order_by(Meeting.date.desc(), Meeting.id.desc())
-    page_data = _paginate(query)
-    items = [{
-        "id": m.id,
-        "title": m.title,
-        "date": m.date.isoformat(),
-        "attendees": m.attendees,
-        "notes": m.notes,
-        "created_at": m.created_at.isoformat()
-    } for m in page_data.items]
-
-    return jsonify({
-        "items": items,
-        "page": page_data.page,
-        "pages": page_data.pages,
-        "total": page_data.total
-    }), 200
+        for row, m in zip(items, rows):
+            row["snippet"] = m.snippet
+
+    return jsonify({"items": items, **meta}), 200
 
 @meetings_bp.post("")
 @jwt_required()
 def create_meeting():
-    uid = int(get_jwt_identity())
+    uid = current_uid()
     data, err = require_json()                 
     if err:
         return err
@@ -65,30 +85,61 @@ def create_meeting():
         notes=data.get("notes"),
     )
     db.session.add(meeting)
+    meeting.sync_version = bump_data_version(uid)
+    record_meetings(uid, {date_val: 1})
     db.session.commit()
     return jsonify({"id": meeting.id}), 201
 
 @meetings_bp.get("/<int:meeting_id>")
 @jwt_required()
+@replica_read
+@conditional
 def get_meeting(meeting_id):
-    uid = int(get_jwt_identity())
-    m = Meeting.query.filter_by(id=meeting_id, user_id=uid).first()
+    uid = current_uid()
+    include = set(filter(None, (request.args.get("include") or "").split(",")))
+    if include - {"action_items"}:
+        return jsonify({"error": "ValidationError", "message": "include must be one of ['action_items']"}), 400
+    try:
+        dump = sparse(meeting_json, request.args.get("fields"))
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+
+    m = db.session.query(*columns_for(Meeting, dump)).filter(Meeting.id == meeting_id, Meeting.user_id == uid).first()
     if not m:
         return jsonify({"error": "NotFound", "message": "not found"}), 404 
-    return jsonify({
-        "id": m.id,
-        "title": m.title,
-        "date": m.date.isoformat(),
-        "attendees": m.attendees,
-        "notes": m.notes,
-        "created_at": m.created_at.isoformat()
-    }), 200
+
+    body = dump(m)
+    if include:
+        body["action_items"] = [item_json(it) for it in meeting_items_query(m.id)]
+    return jsonify(body), 200
+
+def meeting_items_query(meeting_id, columns=ITEM_COLUMNS):
+    # same order as the Meeting.action_items relationship
+    return (db.session.query(*columns)
+            .filter(ActionItem.meeting_id == meeting_id)
+            .order_by(*sort_clauses(ITEM_SORT)))
+
+@meetings_bp.get("/<int:meeting_id>/action-items")
+@jwt_required()
+@replica_read
+@conditional
+def list_meeting_items(meeting_id):
+    uid = current_uid()
+    try:
+        dump = sparse(item_json, request.args.get("fields"))
+    except ValueError as ex:
+        return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+    m = db.session.query(Meeting.id).filter(Meeting.id == meeting_id, Meeting.user_id == uid).first()
+    if not m:
+        return jsonify({"error": "NotFound", "message": "not found"}), 404
+    items = meeting_items_query(m.id, columns_for(ActionItem, dump))
+    return jsonify({"meeting_id": m.id, "items": [dump(it) for it in items]}), 200
 
 @meetings_bp.patch("/<int:meeting_id>")
 @jwt_required()
 def update_meeting(meeting_id):
-    uid = int(get_jwt_identity())
-    m = Meeting.query.filter_by(id=meeting_id, user_id=uid).first()
+    uid = current_uid()
+    m = owned(Meeting, meeting_id)
     if not m:
         return jsonify({"error": "NotFound", "message": "not found"}), 404  
 
@@ -104,9 +155,11 @@ def update_meeting(meeting_id):
 
     if "date" in data:
         try:
-            m.date = parse_iso_date(ensure_nonempty(data.get("date"), "date"))
+            new_date = parse_iso_date(ensure_nonempty(data.get("date"), "date"))
         except ValueError as ex:
             return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+        record_meetings(uid, {m.date: -1, new_date: 1})
+        m.date = new_date
 
     if "attendees" in data:
         m.attendees = data.get("attendees")
@@ -114,16 +167,51 @@ def update_meeting(meeting_id):
     if "notes" in data:
         m.notes = data.get("notes")
 
+    m.sync_version = bump_data_version(uid)
     db.session.commit()
     return jsonify({"message": "updated"}), 200
 
 @meetings_bp.delete("/<int:meeting_id>")
 @jwt_required()
 def delete_meeting(meeting_id):
-    uid = int(get_jwt_identity())
-    m = Meeting.query.filter_by(id=meeting_id, user_id=uid).first()
+    uid = current_uid()
+    m = owned(Meeting, meeting_id)
     if not m:
         return jsonify({"error": "NotFound", "message": "not found"}), 404 
+    forget_meetings(uid, [m])
+    record_deletes(uid, bump_data_version(uid), meeting_ids=[m.id])
+    # items go with it through ON DELETE CASCADE (passive_deletes: not loaded here)
     db.session.delete(m)
     db.session.commit()
     return jsonify({"message": "deleted"}), 204
+
+MAX_BULK_DELETE = 100
+
+@meetings_bp.delete("")
+@jwt_required()
+def delete_meetings():
+    uid = current_uid()
+    try:
+        ids = sorted({int(part) for part in (request.args.get("ids") or "").split(",") if part.strip()})
+    except ValueError:
+        return jsonify({"error": "ValidationError", "message": "ids must be a comma-separated list of integers"}), 400
+    if not ids:
+        return jsonify({"error": "ValidationError", "message": "ids is required"}), 400
+    if len(ids) > MAX_BULK_DELETE:
+        return jsonify({"error": "ValidationError", "message": f"at most {MAX_BULK_DELETE} ids per request"}), 400
+
+    found = db.session.query(Meeting.id, Meeting.date).filter(
+        Meeting.user_id == uid, Meeting.id.in_(ids)).all()
+    missing = sorted(set(ids) - {m.id for m in found})
+    if missing:
+        # all or nothing, like /action-items/batch
+        return jsonify({"error": "NotFound", "message": "not found", "ids": missing}), 404
+
+    forget_meetings(uid, found)
+    record_deletes(uid, bump_data_version(uid), meeting_ids=ids)
+    db.session.execute(
+        delete(Meeting).where(Meeting.user_id == uid, Meeting.id.in_(ids)),
+        execution_options={"synchronize_session": False},
+    )
+    db.session.commit()
+    return jsonify({"message": "deleted"}), 204
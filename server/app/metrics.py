@@ -0,0 +1,193 @@
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from flask import Blueprint, Response, current_app, request
+from sqlalchemy import event
+from . import db
+
+# Request instrumentation, all off by default:
+#   METRICS_ENABLED   per-endpoint latency / DB-time / query-count histograms
+#                     and OpenAI call latency, served at GET /metrics in the
+#                     Prometheus text format
+#   SERVER_TIMING     a Server-Timing header (app, db) on every response
+#   SLOW_QUERY_MS     log statements slower than this (0 = off)
+# Nothing is hooked when all three are off: no request hooks, no cursor
+# events, no /metrics route, and ai_call() returns after one attribute check.
+#
+# Histograms are per process. Behind several workers, scrape each one (or
+# aggregate with sum() in PromQL); a restart resets the counters, which
+# Prometheus' rate() already handles. Durations are measured until the view
+# returns, so for streamed responses (export, SSE) they exclude the body.
+
+log = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+AI_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+metrics_bp = Blueprint("metrics", __name__)
+
+_local = threading.local()
+
+
+class Histogram:
+    def __init__(self, name, help, labels, buckets):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, value, *label_values):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            s = self._series.get(label_values)
+            if s is None:
+                s = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            s[0][i] += 1
+            s[1] += value
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = [(k, list(c), total) for k, (c, total) in self._series.items()]
+        for label_values, counts, total in sorted(series):
+            labels = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.labels, label_values))
+            sep = "," if labels else ""
+            running = 0
+            for le, n in zip(self.buckets, counts):
+                running += n
+                yield f'{self.name}_bucket{{{labels}{sep}le="{le}"}} {running}'
+            running += counts[-1]
+            yield f'{self.name}_bucket{{{labels}{sep}le="+Inf"}} {running}'
+            yield f"{self.name}_sum{{{labels}}} {total}"
+            yield f"{self.name}_count{{{labels}}} {running}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    def __init__(self):
+        self.enabled = False
+        self.server_timing = False
+        self.slow_query_s = 0.0
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+        self.requests = Histogram(
+            "http_request_duration_seconds", "Time until the view returned.",
+            ("method", "endpoint", "status"), LATENCY_BUCKETS)
+        self.db_time = Histogram(
+            "http_request_db_seconds", "Time spent in SQL statements per request.",
+            ("method", "endpoint"), LATENCY_BUCKETS)
+        self.queries = Histogram(
+            "http_request_queries", "SQL statements per request.",
+            ("method", "endpoint"), QUERY_BUCKETS)
+        self.ai_calls = Histogram(
+            "openai_request_duration_seconds", "Chat completion calls (streamed calls until the last chunk).",
+            ("kind", "outcome"), AI_BUCKETS)
+
+    def init_app(self, app):
+        self.enabled = app.config["METRICS_ENABLED"]
+        self.server_timing = app.config["SERVER_TIMING"]
+        self.slow_query_s = app.config["SLOW_QUERY_MS"] / 1000
+        app.extensions["metrics"] = self
+        if not (self.enabled or self.server_timing or self.slow_query_s):
+            return
+
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", _before_cursor)
+            event.listen(engine, "after_cursor_execute", _after_cursor)
+        app.before_request(_start_request)
+        app.after_request(self._finish_request)
+        if self.enabled:
+            app.register_blueprint(metrics_bp)
+
+    def _finish_request(self, resp):
+        state = getattr(_local, "request", None)
+        _local.request = None
+        if state is None:
+            return resp
+        started, db_s, n = state
+        elapsed = time.perf_counter() - started
+        if self.enabled:
+            endpoint = request.url_rule.rule if request.url_rule else "<unmatched>"
+            self.requests.observe(elapsed, request.method, endpoint, str(resp.status_code))
+            self.db_time.observe(db_s, request.method, endpoint)
+            self.queries.observe(n, request.method, endpoint)
+        if self.server_timing:
+            resp.headers.add(
+                "Server-Timing", f'app;dur={elapsed * 1000:.1f}, db;dur={db_s * 1000:.1f};desc="{n} queries"'
+            )
+        return resp
+
+    def render(self):
+        lines = []
+        for h in (self.requests, self.db_time, self.queries, self.ai_calls):
+            lines.extend(h.render())
+        lines += [
+            "# HELP db_slow_queries_total Statements slower than SLOW_QUERY_MS.",
+            "# TYPE db_slow_queries_total counter",
+            f"db_slow_queries_total {self.slow_queries}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def _start_request():
+    _local.request = [time.perf_counter(), 0.0, 0]
+
+
+def _before_cursor(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    # background threads (AI jobs) have no request state
+    state = getattr(_local, "request", None)
+    if state is not None:
+        state[1] += elapsed
+        state[2] += 1
+    if metrics.slow_query_s and elapsed >= metrics.slow_query_s:
+        with metrics._lock:
+            metrics.slow_queries += 1
+        where = f" [{request.method} {request.path}]" if state is not None else ""
+        log.warning("slow query (%.1f ms)%s: %s", elapsed * 1000, where, " ".join(statement.split())[:1000])
+
+
+@contextmanager
+def ai_call(kind):
+    """
+    Time an OpenAI call into openai_request_duration_seconds when metrics are on.
+    """
+    if not metrics.enabled:
+        yield
+        return
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    except GeneratorExit:
+        outcome = "cancelled"
+        raise
+    finally:
+        metrics.ai_calls.observe(time.perf_counter() - started, kind, outcome)
+
+
+@metrics_bp.get("/metrics")
+def prometheus_metrics():
+    token = current_app.config["METRICS_TOKEN"]
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return Response("unauthorized\n", status=401, mimetype="text/plain")
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
@@ -7,27 +7,102 @@ class User(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    # bumped on every meeting/item write; feeds the ETags in app/etag.py
+    data_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
 class Meeting(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     date = db.Column(db.Date, nullable=False)
     attendees = db.Column(db.Text)
-    notes = db.Column(db.Text)
+    # unbounded; only loaded when accessed (list endpoints leave it out by default)
+    notes = db.deferred(db.Column(db.Text))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # user.data_version of the write that last touched the row; GET /sync cursor
+    sync_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
-    user = db.relationship("User", backref=db.backref("meetings", lazy=True, cascade="all, delete"))
+    # populated only by search queries (see app/search.py)
+    snippet = db.query_expression()
+
+    user = db.relationship("User", backref=db.backref("meetings", lazy=True, cascade="all, delete", passive_deletes=True))
 
 class ActionItem(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    meeting_id = db.Column(db.Integer, db.ForeignKey("meeting.id"), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    meeting_id = db.Column(db.Integer, db.ForeignKey("meeting.id", ondelete="CASCADE"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     title = db.Column(db.String(200), nullable=False)
     due_date = db.Column(db.Date)
     status = db.Column(db.String(10), default="open", nullable=False)
     assignee = db.Column(db.String(120))
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version = db.Column(db.Integer, default=0, server_default="0", nullable=False)
 
-    meeting = db.relationship("Meeting", backref=db.backref("action_items", lazy=True, cascade="all, delete"))
+    meeting = db.relationship("Meeting", backref=db.backref(
+        "action_items", lazy=True, cascade="all, delete", passive_deletes=True,
+        order_by=lambda: (ActionItem.due_date.is_(None), ActionItem.due_date, ActionItem.id.desc()),
+    ))
     user = db.relationship("User")
+
+class UserStats(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    open_items = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    done_items = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+
+class UserMonthStats(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    month = db.Column(db.String(7), primary_key=True)  # YYYY-MM
+    meetings = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+
+class AiJob(db.Model):
+    id = db.Column(db.String(32), primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    key = db.Column(db.String(64), nullable=False, index=True)
+    status = db.Column(db.String(10), default="queued", nullable=False)
+    notes = db.Column(db.Text, nullable=False)
+    items = db.Column(db.Text)
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+# a deleted meeting or action item, kept so GET /sync can report the delete
+class Tombstone(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
+    kind = db.Column(db.String(10), nullable=False)  # "meeting" | "item"
+    object_id = db.Column(db.Integer, nullable=False)
+    sync_version = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+class AiSuggestionCache(db.Model):
+    key = db.Column(db.String(64), primary_key=True)
+    items = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+
+# Composite indexes matching the list endpoints' filter + sort keys.
+# "due_date IS NULL" is the portable spelling of NULLS LAST so the same
+# expression can be indexed on SQLite and PostgreSQL.
+db.Index("ix_meeting_user_date", Meeting.user_id, Meeting.date, Meeting.id)
+db.Index(
+    "ix_action_item_user_due",
+    ActionItem.user_id, ActionItem.due_date.is_(None), ActionItem.due_date, ActionItem.id.desc(),
+)
+# GET /meetings/<id> and /meetings/<id>/action-items (ITEM_SORT within one
+# meeting); the meeting_id prefix also serves the foreign key's cascade
+db.Index(
+    "ix_action_item_meeting_due",
+    ActionItem.meeting_id, ActionItem.due_date.is_(None), ActionItem.due_date, ActionItem.id.desc(),
+)
+db.Index(
+    "ix_action_item_user_status_due",
+    ActionItem.user_id, ActionItem.status, ActionItem.due_date.is_(None), ActionItem.due_date, ActionItem.id.desc(),
+)
+
+# GET /sync: rows changed after a given user.data_version
+db.Index("ix_meeting_user_sync", Meeting.user_id, Meeting.sync_version)
+db.Index("ix_action_item_user_sync", ActionItem.user_id, ActionItem.sync_version)
+db.Index("ix_tombstone_user_sync", Tombstone.user_id, Tombstone.sync_version)
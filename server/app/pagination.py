@@ -0,0 +1,131 @@
+import base64
+import json
+from collections import namedtuple
+from datetime import date
+from flask import request
+from sqlalchemy import and_, or_, false, literal
+
+MAX_PER_PAGE = 50
+
+# One column of a stable sort order. `value` reads the same key back off a result row.
+# A nullable key must be preceded by an `expr IS NULL` key so NULLs form their own group.
+SortKey = namedtuple("SortKey", ["expr", "desc", "value"])
+
+
+def sort_clauses(keys):
+    return [k.expr.desc() if k.desc else k.expr.asc() for k in keys]
+
+
+def encode_cursor(values):
+    raw = json.dumps([v.isoformat() if isinstance(v, date) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, types):
+    """
+    Decode a token from encode_cursor() whose values must be of `types`
+    (date, int or bool; any may be None). Raises ValueError otherwise.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except Exception:
+        raise ValueError("invalid cursor")
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("invalid cursor")
+    decoded = []
+    for v, t in zip(values, types):
+        if t is date and isinstance(v, str):
+            try:
+                v = date.fromisoformat(v)
+            except ValueError:
+                raise ValueError("invalid cursor")
+        # type() rather than isinstance(): bool is an int, and a date slot must not take an int
+        if v is not None and type(v) is not t:
+            raise ValueError("invalid cursor")
+        decoded.append(v)
+    return decoded
+
+
+def _key_types(keys):
+    return [k.expr.type.python_type for k in keys]
+
+
+def _after(keys, values):
+    """
+    WHERE clause selecting rows strictly after `values` in `keys` order.
+    Expands to k1 > v1 OR (k1 = v1 AND k2 > v2) OR ..., with a leading
+    k1 >= v1 bound so the planner can turn it into an index range.
+    """
+    # literal() keeps boolean keys (e.g. `due_date IS NULL`) comparable with < and >
+    values = [None if v is None else literal(v) for v in values]
+    branches = []
+    for i, key in enumerate(keys):
+        v = values[i]
+        if v is None:
+            strict = false()  # nothing sorts after NULL inside its group
+        else:
+            strict = key.expr < v if key.desc else key.expr > v
+        prefix = [
+            k.expr.is_(None) if pv is None else k.expr == pv
+            for k, pv in zip(keys[:i], values[:i])
+        ]
+        branches.append(and_(*prefix, strict))
+
+    cond = or_(*branches)
+    first, v0 = keys[0], values[0]
+    if v0 is not None:
+        cond = and_(first.expr <= v0 if first.desc else first.expr >= v0, cond)
+    return cond
+
+
+def _flag(name, default):
+    raw = request.args.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes"}
+
+
+def paginate(query, keys=None):
+    """
+    Paginate an ordered query from the request args; returns (rows, meta).
+
+    ?page=N          offset mode (default); meta has page, has_next and,
+                     unless with_total=0, total and pages.
+    ?cursor=<token>  keyset mode over `keys` (an empty token starts at the
+                     top); meta has next_cursor, and total only if with_total=1.
+
+    Raises ValueError on a malformed cursor or when `keys` is None.
+    """
+    per_page = request.args.get("per_page", 10, type=int)
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    cursor = request.args.get("cursor")
+
+    if cursor is not None:
+        if keys is None:
+            raise ValueError("cursor pagination is not supported for this query")
+        with_total = _flag("with_total", False)
+        page_query = query
+        if cursor:
+            page_query = query.filter(_after(keys, decode_cursor(cursor, _key_types(keys))))
+        rows = page_query.limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        meta = {
+            "next_cursor": encode_cursor([k.value(rows[-1]) for k in keys]) if has_next else None,
+            "per_page": per_page,
+        }
+    else:
+        with_total = _flag("with_total", True)
+        page = max(1, request.args.get("page", 1, type=int))
+        rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        meta = {"page": page, "per_page": per_page, "has_next": has_next}
+
+    if with_total:
+        total = query.order_by(None).count()
+        meta["total"] = total
+        if cursor is None:
+            meta["pages"] = -(-total // per_page)
+    return rows, meta
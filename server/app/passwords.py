@@ -0,0 +1,58 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from . import bcrypt
+
+
+class HasherBusy(Exception):
+    pass
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a small dedicated pool so a login burst occupies at most
+    PASSWORD_HASH_CONCURRENCY cores and leaves the other request threads
+    free for CRUD. Up to PASSWORD_HASH_MAX_PENDING more calls may wait for a
+    slot; beyond that hash()/check() raise HasherBusy instead of queueing
+    without bound (the views answer 503 with Retry-After).
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._slots = None
+        self.rounds = 12
+
+    def init_app(self, app):
+        self.rounds = app.config["BCRYPT_LOG_ROUNDS"]
+        workers = app.config["PASSWORD_HASH_CONCURRENCY"]
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(workers + app.config["PASSWORD_HASH_MAX_PENDING"])
+        app.extensions["password_hasher"] = self
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def hash(self, password):
+        return self._run(bcrypt.generate_password_hash, password, self.rounds).decode("utf-8")
+
+    def check(self, pw_hash, password):
+        return self._run(bcrypt.check_password_hash, pw_hash, password)
+
+    def needs_rehash(self, pw_hash):
+        """
+        True if the hash was made with a cost other than BCRYPT_LOG_ROUNDS.
+        """
+        try:
+            return int(pw_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+
+password_hasher = PasswordHasher()
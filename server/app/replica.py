@@ -0,0 +1,70 @@
+import threading
+import time
+from functools import wraps
+from flask import current_app, g, has_app_context
+from flask_jwt_extended import get_jwt_identity
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+# Optional read replica. With DATABASE_REPLICA_URL set, views wrapped in
+# @replica_read run their queries on the "replica" bind; everything else, and
+# any flush or INSERT/UPDATE/DELETE, stays on the primary. A user who wrote
+# in the last REPLICA_STICKY_SECONDS keeps reading from the primary so they
+# see their own changes despite replication lag.
+#
+# The sticky window is tracked per process (write handlers already funnel
+# through bump_data_version, which calls note_write). Behind several workers
+# without session affinity a follow-up read can land on a worker that did not
+# see the write; keep the window comfortably above the replica's usual lag.
+
+REPLICA = "replica"
+
+_lock = threading.Lock()
+_last_write = {}
+
+
+def note_write(uid):
+    """
+    Pin the user's reads to the primary for the sticky window.
+    """
+    with _lock:
+        _last_write[uid] = time.monotonic()
+
+
+def _recently_wrote(uid, window):
+    now = time.monotonic()
+    with _lock:
+        at = _last_write.get(uid)
+        if at is not None and now - at >= window:
+            del _last_write[uid]
+            at = None
+    return at is not None
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and has_app_context()
+            and g.get("db_replica")
+            and not self._flushing
+            and not isinstance(clause, UpdateBase)
+        ):
+            engine = self._db.engines.get(REPLICA)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def replica_read(view):
+    """
+    Route a read-only view's queries to the replica (place under @jwt_required()).
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if REPLICA in current_app.config["SQLALCHEMY_BINDS"]:
+            uid = get_jwt_identity()
+            if uid is None or not _recently_wrote(int(uid), current_app.config["REPLICA_STICKY_SECONDS"]):
+                g.db_replica = True
+        return view(*args, **kwargs)
+    return wrapper
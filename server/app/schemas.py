@@ -15,6 +15,7 @@ class MeetingSchema(ma.Schema):
     attendees = fields.Str(allow_none=True)
     notes = fields.Str(allow_none=True)
     created_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True, allow_none=True)
 
 class ActionItemSchema(ma.Schema):
     id = fields.Int(dump_only=True)
@@ -25,3 +26,4 @@ class ActionItemSchema(ma.Schema):
     status = fields.Str(validate=validate.OneOf(["open", "done"]), load_default="open")
     assignee = fields.Str(allow_none=True)
     created_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True, allow_none=True)
@@ -0,0 +1,109 @@
+import re
+from sqlalchemy import cast, func, literal_column, null, or_, table, column, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import with_expression
+from . import db
+from .models import Meeting
+
+# Full-text search over meeting title, attendees and notes.
+#   SQLite:     external-content FTS5 table `meeting_fts`, kept in sync by triggers
+#   PostgreSQL: generated `meeting.search_vector` tsvector column with a GIN index
+# Both are created by migration; anything else falls back to ILIKE.
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# The snippet is an HTML fragment built from user text, so the database
+# highlights with private-use placeholders, the text is HTML-escaped, and only
+# then are the placeholders turned into the <mark> tags.
+_START, _END = "\ue000", "\ue001"
+_ESCAPES = [("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#x27;"),
+            (_START, HIGHLIGHT_START), (_END, HIGHLIGHT_END)]
+
+_fts = table("meeting_fts", column("rowid"))
+_backends = {}
+
+
+def _backend():
+    engine = db.engine
+    key = str(engine.url)
+    if key not in _backends:
+        name = None
+        with engine.connect() as conn:
+            if engine.dialect.name == "sqlite":
+                found = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'meeting_fts'"
+                )).first()
+                name = "fts5" if found else None
+            elif engine.dialect.name == "postgresql":
+                found = conn.execute(text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = 'meeting' AND column_name = 'search_vector'"
+                )).first()
+                name = "tsvector" if found else None
+        _backends[key] = name
+    return _backends[key]
+
+
+def _fts5_match(q):
+    # Quote every token so user input can never be parsed as FTS5 syntax; prefix-match each.
+    tokens = re.findall(r"\w+", q)
+    return " ".join(f'"{t}"*' for t in tokens)
+
+
+def _html(snippet):
+    # html.escape() in SQL: nested replace(), & first
+    for old, new in _ESCAPES:
+        snippet = func.replace(snippet, old, new)
+    return snippet
+
+
+def search_meetings(uid, q, columns=None):
+    """
+    Return a Meeting query for the user's meetings matching `q`, best match first.
+    Each Meeting has `.snippet` populated with a highlighted excerpt. With
+    `columns`, rows are those columns plus `snippet` instead of entities.
+    """
+    query = (db.session.query(*columns) if columns else Meeting.query).filter(Meeting.user_id == uid)
+    backend = _backend()
+
+    def with_snippet(query, snippet):
+        snippet = _html(snippet)
+        if columns:
+            return query.add_columns(snippet.label("snippet"))
+        return query.options(with_expression(Meeting.snippet, snippet))
+
+    if backend == "fts5":
+        match = _fts5_match(q)
+        if not match:
+            return (query.add_columns(null().label("snippet")) if columns else query).filter(text("0"))
+        fts = literal_column("meeting_fts")
+        snippet = func.snippet(fts, -1, _START, _END, "…", 16)
+        return (
+            with_snippet(query.join(_fts, _fts.c.rowid == Meeting.id), snippet)
+            .filter(fts.op("MATCH")(match))
+            # bm25 is lower-is-better; weights favour title, then attendees, then notes
+            .order_by(func.bm25(fts, 10.0, 5.0, 1.0), Meeting.date.desc(), Meeting.id.desc())
+        )
+
+    if backend == "tsvector":
+        config = cast("english", REGCONFIG)
+        vector = literal_column("meeting.search_vector")
+        tsq = func.websearch_to_tsquery(config, q)
+        document = func.concat_ws(" — ", Meeting.title, Meeting.attendees, Meeting.notes)
+        snippet = func.ts_headline(
+            config, document, tsq,
+            f"StartSel={_START}, StopSel={_END}, MaxWords=24, MinWords=8",
+        )
+        return (
+            with_snippet(query, snippet)
+            .filter(vector.op("@@")(tsq))
+            .order_by(func.ts_rank_cd(vector, tsq).desc(), Meeting.date.desc(), Meeting.id.desc())
+        )
+
+    like = f"%{q}%"
+    return (
+        (query.add_columns(null().label("snippet")) if columns else query)
+        .filter(or_(Meeting.title.ilike(like), Meeting.attendees.ilike(like), Meeting.notes.ilike(like)))
+        .order_by(Meeting.date.desc(), Meeting.id.desc())
+    )
@@ -0,0 +1,28 @@
+from sqlalchemy import event
+from . import db
+
+# SQLite needs per-connection settings that other databases keep in the
+# schema or server config. They are applied from the engine's "connect" event,
+# so every pooled connection gets them, including the ones Flask-Migrate opens.
+# The set comes from SQLITE_PRAGMAS (see the profiles in config.py); keep
+# foreign_keys=ON in it so ON DELETE CASCADE removes a meeting's items.
+
+
+def _listen(engine, statements):
+    def on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        for stmt in statements:
+            cur.execute(stmt)
+        cur.close()
+
+    event.listen(engine, "connect", on_connect)
+
+
+def init_app(app):
+    statements = [f"PRAGMA {name}={value}" for name, value in app.config["SQLITE_PRAGMAS"].items()]
+    with app.app_context():
+        engines = dict(db.engines)
+    for key, engine in engines.items():
+        if engine.dialect.name == "sqlite":
+            # a replica file is never written through this app
+            _listen(engine, statements + ["PRAGMA query_only=ON"] if key == "replica" else statements)
@@ -0,0 +1,145 @@
+from collections import Counter
+from datetime import date, timedelta
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required
+from sqlalchemy import and_, case, extract, false, func
+from sqlalchemy.dialects import postgresql, sqlite
+from . import db
+from .identity import current_uid
+from .models import ActionItem, Meeting, UserMonthStats, UserStats
+from .replica import replica_read
+
+stats_bp = Blueprint("stats", __name__, url_prefix="/stats")
+
+# With STATS_SUMMARY on, the write handlers keep user_stats / user_month_stats
+# current through record_items() / record_meetings() and GET /stats reads those
+# rows instead of counting. Run `flask rebuild-stats` after turning it on.
+
+
+def _summary_enabled():
+    return current_app.config["STATS_SUMMARY"]
+
+
+def _upsert(model, keys, deltas):
+    insert = postgresql.insert if db.engine.dialect.name == "postgresql" else sqlite.insert
+    stmt = insert(model).values(**keys, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={col: getattr(model, col) + getattr(stmt.excluded, col) for col in deltas},
+    )
+    db.session.execute(stmt)
+
+
+def record_items(uid, by_status):
+    """
+    Apply {status: delta} item-count changes for the user; call before commit.
+    """
+    if not _summary_enabled():
+        return
+    deltas = {f"{s}_items": n for s, n in by_status.items() if n}
+    if deltas:
+        _upsert(UserStats, {"user_id": uid}, deltas)
+
+
+def record_meetings(uid, by_date):
+    """
+    Apply {meeting date: delta} changes to the user's meetings-per-month counts.
+    """
+    if not _summary_enabled():
+        return
+    by_month = Counter()
+    for d, n in by_date.items():
+        by_month[f"{d.year:04d}-{d.month:02d}"] += n
+    for month, n in by_month.items():
+        if n:
+            _upsert(UserMonthStats, {"user_id": uid, "month": month}, {"meetings": n})
+
+
+def forget_meetings(uid, meetings):
+    """
+    Drop meetings and their (cascade-deleted) items from the summaries; call before the delete.
+    """
+    if not _summary_enabled() or not meetings:
+        return
+    by_date = Counter()
+    for m in meetings:
+        by_date[m.date] -= 1
+    record_meetings(uid, by_date)
+    counts = db.session.query(ActionItem.status, func.count()).filter(
+        ActionItem.meeting_id.in_([m.id for m in meetings])).group_by(ActionItem.status)
+    record_items(uid, {status: -n for status, n in counts})
+
+
+def due_counts_query(uid, today, soon, only_open_due=False):
+    is_open = ActionItem.status == "open"
+    overdue = func.coalesce(func.sum(case((and_(is_open, ActionItem.due_date < today), 1), else_=0)), 0)
+    due_soon = func.coalesce(func.sum(case(
+        (and_(is_open, ActionItem.due_date >= today, ActionItem.due_date <= soon), 1), else_=0
+    )), 0)
+    cols = [overdue, due_soon]
+    if not only_open_due:
+        cols += [
+            func.coalesce(func.sum(case((is_open, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((ActionItem.status == "done", 1), else_=0)), 0),
+        ]
+    query = db.session.query(*cols).filter(ActionItem.user_id == uid)
+    if only_open_due:
+        # a range of ix_action_item_user_status_due: (user, 'open', not null, due <= soon)
+        query = query.filter(is_open, ActionItem.due_date.is_(None) == false(), ActionItem.due_date <= soon)
+    return query
+
+
+# no ETag here: overdue / due-soon change with the calendar, not only with writes
+@stats_bp.get("")
+@jwt_required()
+@replica_read
+def get_stats():
+    uid = current_uid()
+    days = max(1, min(request.args.get("due_soon_days", 7, type=int), 90))
+    today = date.today()
+    soon = today + timedelta(days=days)
+
+    if _summary_enabled():
+        source = "summary"
+        row = db.session.get(UserStats, uid)
+        open_n, done_n = (row.open_items, row.done_items) if row else (0, 0)
+        overdue, due_soon = due_counts_query(uid, today, soon, only_open_due=True).one()
+        per_month = [
+            (r.month, r.meetings)
+            for r in UserMonthStats.query.filter_by(user_id=uid).order_by(UserMonthStats.month)
+            if r.meetings
+        ]
+    else:
+        source = "live"
+        overdue, due_soon, open_n, done_n = due_counts_query(uid, today, soon).one()
+        year, month = extract("year", Meeting.date), extract("month", Meeting.date)
+        per_month = [
+            (f"{int(y):04d}-{int(m):02d}", n)
+            for y, m, n in db.session.query(year, month, func.count())
+            .filter(Meeting.user_id == uid).group_by(year, month).order_by(year, month)
+        ]
+
+    return jsonify({
+        "items": {"open": open_n, "done": done_n, "overdue": overdue, "due_soon": due_soon, "due_soon_days": days},
+        "meetings": {
+            "total": sum(n for _, n in per_month),
+            "per_month": [{"month": m, "count": n} for m, n in per_month],
+        },
+        "source": source,
+    }), 200
+
+
+def rebuild_summaries():
+    """
+    Recompute every user's summary rows from the base tables.
+    """
+    UserStats.query.delete()
+    UserMonthStats.query.delete()
+    open_n = func.sum(case((ActionItem.status == "open", 1), else_=0))
+    done_n = func.sum(case((ActionItem.status == "done", 1), else_=0))
+    for uid, o, d in db.session.query(ActionItem.user_id, open_n, done_n).group_by(ActionItem.user_id):
+        db.session.add(UserStats(user_id=uid, open_items=o, done_items=d))
+    year, month = extract("year", Meeting.date), extract("month", Meeting.date)
+    for uid, y, m, n in db.session.query(Meeting.user_id, year, month, func.count()).group_by(Meeting.user_id, year, month):
+        db.session.add(UserMonthStats(user_id=uid, month=f"{int(y):04d}-{int(m):02d}", meetings=n))
+    db.session.commit()
@@ -0,0 +1,84 @@
+from datetime import date, datetime, timedelta
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import jwt_required
+from . import db
+from .action_items import ITEM_COLUMNS
+from .etag import data_version, parse_sync_token, sync_token
+from .identity import current_uid
+from .meetings import MEETING_COLUMNS
+from .models import ActionItem, Meeting, Tombstone
+from .replica import replica_read
+from .serializers import item_json, meeting_json
+
+sync_bp = Blueprint("sync", __name__, url_prefix="/sync")
+
+# GET /sync?since=<token> returns what changed after the token: rows whose
+# sync_version is newer, plus tombstones for deletes. All three lookups are
+# range scans on the (user_id, sync_version) indexes, so the cost follows the
+# number of changes, not the size of the account.
+#
+# The version is read before the rows, so a write that commits in between is
+# sent again next time instead of being missed; clients apply `deleted` first
+# and then upsert `meetings` / `items` by id.
+
+
+def sync_queries(uid, since=None):
+    """
+    (meetings, items, tombstones) queries for changes after version `since`;
+    since=None selects the full snapshot (and no tombstones).
+    """
+    meetings = db.session.query(*MEETING_COLUMNS).filter(Meeting.user_id == uid)
+    items = db.session.query(*ITEM_COLUMNS).filter(ActionItem.user_id == uid)
+    tombstones = db.session.query(Tombstone.kind, Tombstone.object_id).filter(Tombstone.user_id == uid)
+    if since is not None:
+        meetings = meetings.filter(Meeting.sync_version > since)
+        items = items.filter(ActionItem.sync_version > since)
+        tombstones = tombstones.filter(Tombstone.sync_version > since)
+    return (
+        meetings.order_by(Meeting.sync_version),
+        items.order_by(ActionItem.sync_version),
+        tombstones.order_by(Tombstone.sync_version),
+    )
+
+
+@sync_bp.get("")
+@jwt_required()
+@replica_read
+def sync():
+    uid = current_uid()
+    version = data_version(uid)
+
+    since = None
+    token = request.args.get("since")
+    if token:
+        try:
+            since, issued = parse_sync_token(token)
+        except ValueError as ex:
+            return jsonify({"error": "ValidationError", "message": str(ex)}), 400
+        # tombstones before the retention window may be gone, and a version from
+        # the future means the data was reset: either way, start over
+        if (date.today() - issued).days > current_app.config["SYNC_TOMBSTONE_DAYS"] or since > version:
+            since = None
+
+    meetings, items, tombstones = sync_queries(uid, since)
+    deleted = {"meetings": [], "items": []}
+    if since is not None:
+        for kind, object_id in tombstones:
+            deleted["meetings" if kind == "meeting" else "items"].append(object_id)
+    return jsonify({
+        "meetings": [meeting_json(m) for m in meetings],
+        "items": [item_json(it) for it in items],
+        "deleted": deleted,
+        "reset": since is None,
+        "token": sync_token(version),
+    }), 200
+
+
+def prune_tombstones(days):
+    """
+    Delete tombstones older than `days`; returns the number removed.
+    """
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    n = Tombstone.query.filter(Tombstone.deleted_at < cutoff).delete(synchronize_session=False)
+    db.session.commit()
+    return n
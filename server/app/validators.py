@@ -18,11 +18,35 @@ def ensure_nonempty(value: str, field_name: str):
         raise ValueError(f"{field_name} is required")
     return value.strip()
 
+def ensure_optional_str(value, field_name: str):
+    """
+    Return the value if it is a string or None; else raise ValueError.
+    """
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{field_name} must be a string or null")
+    return value
+
 def ensure_status(value: str):
     """
     Ensure status is one of {'open','done'}; returns the value or raises ValueError.
     """
     allowed = {"open", "done"}
-    if value not in allowed:
+    if not isinstance(value, str) or value not in allowed:
         raise ValueError(f"status must be one of {sorted(allowed)}")
     return value
+
+def parse_date_range(from_str, to_str, max_days=None):
+    """
+    Parse optional ?from=/?to= bounds (inclusive) into (date|None, date|None).
+    Raises ValueError if to < from or the window is wider than max_days.
+    """
+    start = parse_iso_date(from_str) if from_str else None
+    end = parse_iso_date(to_str) if to_str else None
+    if start and end and end < start:
+        raise ValueError("to must not be before from")
+    if max_days is not None:
+        if not (start and end):
+            raise ValueError("from and to are required")
+        if (end - start).days + 1 > max_days:
+            raise ValueError(f"date range must be at most {max_days} days")
+    return start, end
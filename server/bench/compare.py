@@ -0,0 +1,67 @@
+"""
+Compare two bench/endpoints.py reports and flag regressions.
+
+    python bench/compare.py bench-main.json bench-branch.json --tolerance 0.2
+
+A scenario regresses when its p95 latency grows or its throughput drops by
+more than --tolerance (a fraction), when it issues more SQL statements per
+request than before (statement counts are deterministic, so any increase is
+reported), or when it starts returning errors. Exits 1 if anything regressed.
+"""
+import argparse
+import json
+import sys
+
+
+def compare(base, new, tolerance):
+    """
+    Return [(scenario, message)] for every regression from `base` to `new`.
+    """
+    found = []
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            continue
+        if b["p95_ms"] and n["p95_ms"] and n["p95_ms"] > b["p95_ms"] * (1 + tolerance):
+            found.append((name, f"p95 {b['p95_ms']:.2f}ms -> {n['p95_ms']:.2f}ms"))
+        if b["rps"] and n["rps"] is not None and n["rps"] < b["rps"] * (1 - tolerance):
+            found.append((name, f"rps {b['rps']:.1f} -> {n['rps']:.1f}"))
+        if b["sql_per_request"] is not None and n["sql_per_request"] is not None \
+                and n["sql_per_request"] > b["sql_per_request"] + 0.05:
+            found.append((name, f"sql/request {b['sql_per_request']} -> {n['sql_per_request']}"))
+        if n["errors"] > b["errors"]:
+            found.append((name, f"errors {b['errors']} -> {n['errors']}"))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed latency/throughput change (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print(f"{'scenario':<44} {'p95 base':>9} {'p95 new':>9} {'sql base':>9} {'sql new':>9}")
+    for name, n in new["results"].items():
+        b = base["results"].get(name)
+        if b is None:
+            print(f"{name:<44} {'(new)':>9}")
+            continue
+        print(f"{name:<44} {b['p95_ms'] or 0:>9.2f} {n['p95_ms'] or 0:>9.2f} "
+              f"{b['sql_per_request'] or 0:>9.2f} {n['sql_per_request'] or 0:>9.2f}")
+
+    regressions = compare(base, new, args.tolerance)
+    for name, message in regressions:
+        print(f"REGRESSION {name}: {message}")
+    if regressions:
+        sys.exit(1)
+    print("no regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Concurrency benchmark: read and write throughput with several worker processes
+sharing one database, per config profile.
+
+    cd server
+    python bench/concurrency.py --profiles dev,prod-sqlite --workers 4 --seconds 10
+
+Each profile gets a fresh database (a temp SQLite file unless --database-url is
+given), migrated to head and seeded through the bulk importer. Every worker
+process builds its own app, like a gunicorn worker, and loops over a mix of
+GET /meetings, GET /action-items (reads) and POST /meetings, PATCH
+/action-items/:id (writes) for the given duration.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+
+EMAIL, PASSWORD = "bench@example.com", "bench-password"
+
+
+def _app(profile):
+    from app import create_app
+    return create_app(profile)
+
+
+def setup(profile, meetings):
+    """
+    Migrate a fresh database, create the bench user and seed meetings with items.
+    """
+    import contextlib
+    import io
+    from flask_migrate import upgrade
+    from app.importer import import_rows
+    from app.models import User
+
+    app = _app(profile)
+    with app.app_context(), contextlib.redirect_stderr(io.StringIO()):
+        upgrade(directory=os.path.join(SERVER, "migrations"))
+    client = app.test_client()
+    client.post("/auth/register", json={"email": EMAIL, "password": PASSWORD})
+    with app.app_context():
+        uid = User.query.filter_by(email=EMAIL).one().id
+        rows = io.StringIO("".join(
+            json.dumps({
+                "title": f"Seed meeting {i}",
+                "date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                "notes": "Discussed roadmap and owners. " * 10,
+                "action_items": [{"title": f"Follow up {i}"}, {"title": f"Ship {i}", "status": "done"}],
+            }) + "\n"
+            for i in range(meetings)
+        ))
+        import_rows(uid, rows, "ndjson", 500)
+
+
+def _pct(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000
+
+
+def worker(args):
+    profile, seconds, write_ratio, seed = args
+    rnd = random.Random(seed)
+    app = _app(profile)
+    client = app.test_client()
+    token = client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD}).get_json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    item_ids = [it["id"] for it in client.get("/action-items?per_page=50", headers=headers).get_json()["items"]]
+
+    reads, writes, errors = [], [], 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        if rnd.random() < write_ratio:
+            if rnd.random() < 0.5:
+                resp = client.post("/meetings", json={"title": "Bench", "date": "2025-01-15"}, headers=headers)
+            else:
+                resp = client.patch(f"/action-items/{rnd.choice(item_ids)}",
+                                    json={"status": rnd.choice(["open", "done"])}, headers=headers)
+            bucket = writes
+        else:
+            if rnd.random() < 0.5:
+                resp = client.get(f"/meetings?page={rnd.randint(1, 5)}", headers=headers)
+            else:
+                resp = client.get("/action-items?status=open", headers=headers)
+            bucket = reads
+        if resp.status_code >= 400:
+            errors += 1
+        else:
+            bucket.append(time.perf_counter() - started)
+    return reads, writes, errors
+
+
+def run(profile, workers, seconds, write_ratio):
+    with mp.get_context("spawn").Pool(workers) as pool:
+        results = pool.map(worker, [(profile, seconds, write_ratio, i) for i in range(workers)])
+    reads = [t for r, _, _ in results for t in r]
+    writes = [t for _, w, _ in results for t in w]
+    return {
+        "profile": profile,
+        "workers": workers,
+        "reads_per_sec": len(reads) / seconds,
+        "writes_per_sec": len(writes) / seconds,
+        "errors": sum(e for _, _, e in results),
+        "read_p95_ms": _pct(reads, 0.95),
+        "write_p95_ms": _pct(writes, 0.95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", default="dev,prod-sqlite")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--meetings", type=int, default=2000, help="meetings to seed")
+    parser.add_argument("--database-url", help="benchmark an existing (empty) database instead of a temp SQLite file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    print(f"{'profile':<14} {'workers':>7} {'reads/s':>9} {'writes/s':>9} {'errors':>7} {'read p95':>9} {'write p95':>10}")
+    for profile in args.profiles.split(","):
+        tmp = None
+        if args.database_url:
+            os.environ["DATABASE_URL"] = args.database_url
+        else:
+            tmp = tempfile.mkdtemp(prefix="m2a-bench-")
+            os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        try:
+            # Config reads DATABASE_URL at import time, so setup runs in a fresh process too
+            with mp.get_context("spawn").Pool(1) as pool:
+                pool.apply(setup, (profile, args.meetings))
+            r = run(profile, args.workers, args.seconds, args.write_ratio)
+        finally:
+            if tmp:
+                shutil.rmtree(tmp, ignore_errors=True)
+        print(f"{r['profile']:<14} {r['workers']:>7} {r['reads_per_sec']:>9.1f} {r['writes_per_sec']:>9.1f} "
+              f"{r['errors']:>7} {r['read_p95_ms']:>7.1f}ms {r['write_p95_ms']:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Seeded synthetic data: N users, M meetings per user, K action items per meeting.
+
+    cd server
+    python bench/datagen.py --users 20 --meetings 200 --items 3 --seed 1
+
+Rows go through the models in app/models.py (bulk INSERTs, one transaction per
+user) into the database named by DATABASE_URL, which must already be migrated.
+The same seed always produces the same rows. Notes sizes follow a log-normal
+distribution (median about 1.2 KB, a long tail of multi-page transcripts), so
+search, export and the AI endpoints see realistic payloads.
+"""
+import argparse
+import math
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+
+PASSWORD = "bench-password"
+
+NAMES = ["Alice", "Bob", "Carol", "Dan", "Erin", "Frank", "Grace", "Heidi", "Ivan", "Judy", "Mallory", "Niaj",
+         "Olivia", "Peggy", "Rupert", "Sybil", "Trent", "Victor", "Walter", "Yolanda"]
+TOPICS = ["roadmap", "Q3 budget", "hiring plan", "onboarding flow", "billing migration", "incident review",
+          "design review", "release checklist", "customer feedback", "vendor contract", "API deprecation",
+          "search relevance", "mobile launch", "data retention", "on-call rotation", "pricing page"]
+VERBS = ["Draft", "Review", "Send", "Schedule", "Update", "Follow up on", "Prepare", "Finalize", "Share", "Estimate"]
+SENTENCES = [
+    "{a} walked through the current state of the {t}.",
+    "{a} raised a concern about the timeline for the {t}.",
+    "We agreed that {a} will own the {t} going forward.",
+    "{a} and {b} disagreed on scope; decision deferred to next week.",
+    "The {t} is blocked on legal sign-off.",
+    "Action: {a} to {v} the {t} by Friday.",
+    "{b} noted that metrics for the {t} are trending up since the last sync.",
+    "Open question: do we need another review before shipping the {t}?",
+    "{a} will circle back with {b} on the {t} numbers.",
+    "Retro on the {t}: communication was the main gap.",
+]
+
+
+def _notes(rnd, attendees):
+    # log-normal size: median ~1200 chars, ~5% over 5 KB
+    target = min(20000, max(80, int(rnd.lognormvariate(math.log(1200), 0.8))))
+    out, size = [], 0
+    while size < target:
+        s = rnd.choice(SENTENCES).format(
+            a=rnd.choice(attendees), b=rnd.choice(attendees), t=rnd.choice(TOPICS), v=rnd.choice(VERBS).lower()
+        )
+        out.append(s)
+        size += len(s) + 1
+        if rnd.random() < 0.15:
+            out.append("\n")
+    return " ".join(out).replace(" \n ", "\n")
+
+
+def generate(users, meetings, items, seed=0, today=None):
+    """
+    Insert the synthetic data set (run inside an app context). Returns
+    [(user_id, email)] for the generated users; they all share PASSWORD.
+    """
+    from sqlalchemy import insert
+    from app import bcrypt, db
+    from app.models import ActionItem, Meeting, User
+    from app.stats import rebuild_summaries
+
+    rnd = random.Random(seed)
+    today = today or date.today()
+    pw_hash = bcrypt.generate_password_hash(PASSWORD).decode("utf-8")
+    created = []
+    for n in range(users):
+        email = f"bench-{seed}-{n}@example.com"
+        user = User(email=email, password_hash=pw_hash, data_version=1)
+        db.session.add(user)
+        db.session.flush()
+
+        meeting_rows = []
+        for _ in range(meetings):
+            attendees = rnd.sample(NAMES, rnd.randint(2, 8))
+            meeting_rows.append({
+                "user_id": user.id,
+                "title": f"{rnd.choice(TOPICS).capitalize()} sync",
+                "date": today - timedelta(days=rnd.randint(0, 730)),
+                "attendees": ", ".join(attendees),
+                "notes": _notes(rnd, attendees),
+                "sync_version": 1,
+            })
+        meeting_ids = db.session.scalars(
+            insert(Meeting).returning(Meeting.id, sort_by_parameter_order=True), meeting_rows
+        ).all() if meeting_rows else []
+
+        item_rows = []
+        for mid, m in zip(meeting_ids, meeting_rows):
+            names = m["attendees"].split(", ")
+            for _ in range(items):
+                due = m["date"] + timedelta(days=rnd.randint(1, 60)) if rnd.random() < 0.7 else None
+                item_rows.append({
+                    "meeting_id": mid,
+                    "user_id": user.id,
+                    "title": f"{rnd.choice(VERBS)} the {rnd.choice(TOPICS)}",
+                    "due_date": due,
+                    "status": "done" if due and due < today and rnd.random() < 0.6 else "open",
+                    "assignee": rnd.choice(names) if rnd.random() < 0.8 else None,
+                    "sync_version": 1,
+                })
+        if item_rows:
+            db.session.execute(insert(ActionItem), item_rows)
+        db.session.commit()
+        created.append((user.id, email))
+
+    rebuild_summaries()
+    return created
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--meetings", type=int, default=100, help="meetings per user")
+    parser.add_argument("--items", type=int, default=3, help="action items per meeting")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from app import create_app
+    app = create_app()
+    with app.app_context():
+        users = generate(args.users, args.meetings, args.items, args.seed)
+    print(f"created {len(users)} users, {len(users) * args.meetings} meetings, "
+          f"{len(users) * args.meetings * args.items} action items (password: {PASSWORD})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+"""
+Endpoint benchmark: latency, throughput and SQL statements per request for
+every API route, written as JSON so runs can be compared across commits.
+
+    cd server
+    python bench/endpoints.py --users 10 --meetings 100 --items 3 \\
+        --requests 200 --concurrency 4 --output bench-$(git rev-parse --short HEAD).json
+    python bench/compare.py bench-old.json bench-new.json
+
+A fresh database (a temp SQLite file unless --database-url is given) is
+migrated and filled by bench/datagen.py. Each scenario then sends --requests
+requests from --concurrency threads through the Flask test client, so the
+numbers cover the app and the database, not an HTTP server. The AI routes run
+against the offline stub client (AI_PROVIDER=stub). Set-up work a scenario
+needs, like creating the meeting a DELETE removes, is not timed or counted.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = []
+
+_sql = threading.local()
+
+
+def scenario(name):
+    def register(fn):
+        SCENARIOS.append((name, fn))
+        return fn
+    return register
+
+
+class Ctx:
+    """
+    Per-thread state handed to scenarios: a test client, a seeded RNG and a
+    randomly picked user (auth headers plus the ids of their rows).
+    """
+
+    def __init__(self, client, rnd, users):
+        self.client, self.rnd, self._users = client, rnd, users
+        self.pick()
+
+    def pick(self):
+        u = self.rnd.choice(self._users)
+        self.email, self.headers = u["email"], u["headers"]
+        self.meeting_ids, self.item_ids, self.notes = u["meeting_ids"], u["item_ids"], u["notes"]
+
+    def create_meeting(self):
+        resp = self.client.post("/meetings", json={"title": "Bench", "date": date.today().isoformat()},
+                                headers=self.headers)
+        return resp.get_json()["id"]
+
+    def create_item(self):
+        resp = self.client.post("/action-items", json={"meeting_id": self.rnd.choice(self.meeting_ids),
+                                                       "title": "Bench item"}, headers=self.headers)
+        return resp.get_json()["id"]
+
+
+# Each scenario does any untimed set-up and returns the request to time:
+# (method, path, keyword arguments for the test client).
+
+@scenario("GET /")
+def _(c):
+    return "GET", "/", {}
+
+
+@scenario("POST /auth/register")
+def _(c):
+    return "POST", "/auth/register", {"json": {"email": f"{uuid.uuid4().hex}@example.com", "password": "pw"}}
+
+
+@scenario("POST /auth/login")
+def _(c):
+    from datagen import PASSWORD
+    return "POST", "/auth/login", {"json": {"email": c.email, "password": PASSWORD}}
+
+
+@scenario("GET /auth/me")
+def _(c):
+    return "GET", "/auth/me", {}
+
+
+@scenario("GET /meetings")
+def _(c):
+    return "GET", f"/meetings?page={c.rnd.randint(1, 3)}", {}
+
+
+@scenario("GET /meetings?q=")
+def _(c):
+    return "GET", f"/meetings?q={c.rnd.choice(['roadmap', 'budget', 'legal', 'metrics'])}", {}
+
+
+@scenario("GET /meetings?cursor=")
+def _(c):
+    return "GET", "/meetings?cursor=&per_page=20", {}
+
+
+@scenario("GET /meetings/:id")
+def _(c):
+    return "GET", f"/meetings/{c.rnd.choice(c.meeting_ids)}", {}
+
+
+@scenario("GET /meetings/:id?include=action_items")
+def _(c):
+    return "GET", f"/meetings/{c.rnd.choice(c.meeting_ids)}?include=action_items", {}
+
+
+@scenario("GET /meetings/:id/action-items")
+def _(c):
+    return "GET", f"/meetings/{c.rnd.choice(c.meeting_ids)}/action-items", {}
+
+
+@scenario("POST /meetings")
+def _(c):
+    return "POST", "/meetings", {"json": {"title": "Bench", "date": "2025-01-15", "notes": c.notes}}
+
+
+@scenario("PATCH /meetings/:id")
+def _(c):
+    return "PATCH", f"/meetings/{c.rnd.choice(c.meeting_ids)}", {"json": {"title": f"Sync {c.rnd.randint(1, 99)}"}}
+
+
+@scenario("DELETE /meetings/:id")
+def _(c):
+    return "DELETE", f"/meetings/{c.create_meeting()}", {}
+
+
+@scenario("DELETE /meetings?ids=")
+def _(c):
+    ids = ",".join(str(c.create_meeting()) for _ in range(5))
+    return "DELETE", f"/meetings?ids={ids}", {}
+
+
+@scenario("GET /action-items")
+def _(c):
+    return "GET", f"/action-items?page={c.rnd.randint(1, 3)}", {}
+
+
+@scenario("GET /action-items?status=open&due_before=")
+def _(c):
+    return "GET", f"/action-items?status=open&due_before={date.today().isoformat()}", {}
+
+
+@scenario("GET /action-items?cursor=")
+def _(c):
+    return "GET", "/action-items?cursor=&per_page=20", {}
+
+
+@scenario("POST /action-items")
+def _(c):
+    return "POST", "/action-items", {"json": {"meeting_id": c.rnd.choice(c.meeting_ids), "title": "Bench item",
+                                              "due_date": "2030-01-01"}}
+
+
+@scenario("PATCH /action-items/:id")
+def _(c):
+    return "PATCH", f"/action-items/{c.rnd.choice(c.item_ids)}", {"json": {"status": c.rnd.choice(["open", "done"])}}
+
+
+@scenario("DELETE /action-items/:id")
+def _(c):
+    return "DELETE", f"/action-items/{c.create_item()}", {}
+
+
+@scenario("POST /action-items/batch")
+def _(c):
+    ops = [{"op": "create", "meeting_id": c.rnd.choice(c.meeting_ids), "title": f"Batch {i}"} for i in range(5)]
+    ops += [{"op": "update", "id": i, "status": "done"} for i in c.rnd.sample(c.item_ids, min(5, len(c.item_ids)))]
+    return "POST", "/action-items/batch", {"json": {"ops": ops}}
+
+
+@scenario("POST /ai/suggest")
+def _(c):
+    return "POST", "/ai/suggest", {"json": {"notes": c.notes}, "headers": {"Cache-Control": "no-cache"}}
+
+
+@scenario("POST /ai/suggest (cached)")
+def _(c):
+    return "POST", "/ai/suggest", {"json": {"notes": c.notes}}
+
+
+@scenario("POST /ai/suggest?engine=local")
+def _(c):
+    return "POST", "/ai/suggest?engine=local", {"json": {"notes": c.notes}}
+
+
+@scenario("POST /ai/suggest/stream")
+def _(c):
+    return "POST", "/ai/suggest/stream", {"json": {"notes": c.notes}, "headers": {"Cache-Control": "no-cache"}}
+
+
+@scenario("POST /ai/suggest?async=1")
+def _(c):
+    return "POST", "/ai/suggest?async=1", {"json": {"notes": f"{c.notes}\n{uuid.uuid4().hex}"}}
+
+
+@scenario("GET /ai/jobs/:id")
+def _(c):
+    resp = c.client.post("/ai/suggest?async=1", json={"notes": f"{c.notes}\n{uuid.uuid4().hex}"}, headers=c.headers)
+    return "GET", f"/ai/jobs/{resp.get_json()['id']}", {}
+
+
+@scenario("GET /ai/cache/stats")
+def _(c):
+    return "GET", "/ai/cache/stats", {}
+
+
+@scenario("GET /calendar")
+def _(c):
+    end = date.today() - timedelta(days=c.rnd.randint(0, 300))
+    return "GET", f"/calendar?from={(end - timedelta(days=30)).isoformat()}&to={end.isoformat()}", {}
+
+
+@scenario("GET /stats")
+def _(c):
+    return "GET", "/stats", {}
+
+
+@scenario("GET /export?kind=items")
+def _(c):
+    return "GET", "/export?kind=items&format=ndjson", {}
+
+
+@scenario("POST /import")
+def _(c):
+    rows = "".join(json.dumps({"title": f"Imported {i}", "date": "2024-06-01",
+                               "action_items": [{"title": "Follow up"}]}) + "\n" for i in range(10))
+    return "POST", "/import?format=ndjson", {"data": rows}
+
+
+@scenario("GET /sync?since=")
+def _(c):
+    # a client that loaded a page, then saw one change
+    token = c.client.get("/meetings?per_page=1", headers=c.headers).headers["X-Sync-Token"]
+    c.client.patch(f"/action-items/{c.rnd.choice(c.item_ids)}", json={"status": "done"}, headers=c.headers)
+    return "GET", f"/sync?since={token}", {}
+
+
+def _count_sql(conn, cursor, statement, parameters, context, executemany):
+    _sql.count = getattr(_sql, "count", 0) + 1
+
+
+def _pct(values, p):
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * p))] * 1000, 3) if values else None
+
+
+def setup(app, users, meetings, items, seed):
+    """
+    Migrate, generate the data set and build per-user request context.
+    """
+    import contextlib
+    import io
+    from flask_jwt_extended import create_access_token
+    from flask_migrate import upgrade
+    from datagen import generate
+    from app.models import ActionItem, Meeting
+
+    with app.app_context():
+        with contextlib.redirect_stderr(io.StringIO()):
+            upgrade(directory=os.path.join(SERVER, "migrations"))
+        out = []
+        for uid, email in generate(users, meetings, items, seed):
+            token = create_access_token(identity=str(uid), expires_delta=timedelta(hours=12))
+            rows = Meeting.query.filter_by(user_id=uid).with_entities(Meeting.id, Meeting.notes).all()
+            out.append({
+                "email": email,
+                "headers": {"Authorization": f"Bearer {token}"},
+                "meeting_ids": [mid for mid, _ in rows],
+                # a typical notes blob for the AI routes
+                "notes": sorted((n for _, n in rows), key=len)[len(rows) // 2] if rows else "Bob to send the deck.",
+                "item_ids": [i for (i,) in ActionItem.query.filter_by(user_id=uid).with_entities(ActionItem.id)],
+            })
+    return out
+
+
+def run_scenario(app, fn, users, requests, concurrency, warmup, seed):
+    latencies, sql, errors = [], [], 0
+    lock = threading.Lock()
+    per_thread = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+
+    def loop(n, thread_seed):
+        nonlocal errors
+        c = Ctx(app.test_client(), random.Random(thread_seed), users)
+        for i in range(-warmup, n):
+            c.pick()
+            method, path, kwargs = fn(c)
+            kwargs["headers"] = {**c.headers, **kwargs.get("headers", {})}
+            _sql.count = 0
+            started = time.perf_counter()
+            resp = c.client.open(path, method=method, **kwargs)
+            resp.get_data()  # drain streamed bodies inside the timing
+            elapsed = time.perf_counter() - started
+            if i < 0:
+                continue
+            with lock:
+                if resp.status_code >= 400:
+                    errors += 1
+                else:
+                    latencies.append(elapsed)
+                    sql.append(_sql.count)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(loop, per_thread, [seed * 1000 + i for i in range(concurrency)]))
+    wall = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(len(latencies) / wall, 1) if wall else None,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else None,
+        "p50_ms": _pct(latencies, 0.50),
+        "p95_ms": _pct(latencies, 0.95),
+        "p99_ms": _pct(latencies, 0.99),
+        "sql_per_request": round(statistics.fmean(sql), 2) if sql else None,
+        "sql_max": max(sql) if sql else None,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=SERVER, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--meetings", type=int, default=100, help="meetings per user")
+    parser.add_argument("--items", type=int, default=3, help="action items per meeting")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=4, help="client threads per scenario")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed requests per thread before timing")
+    parser.add_argument("--only", help="regex; run only the scenarios whose name matches")
+    parser.add_argument("--profile", default=os.getenv("APP_PROFILE", "dev"))
+    parser.add_argument("--database-url", help="benchmark an existing (empty) database instead of a temp SQLite file")
+    parser.add_argument("--output", help="write the JSON report here (default: stdout)")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        tmp = tempfile.mkdtemp(prefix="m2a-bench-")
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    os.environ["AI_PROVIDER"] = "stub"
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+    from app import create_app
+
+    selected = [(n, fn) for n, fn in SCENARIOS if not args.only or re.search(args.only, n)]
+    try:
+        app = create_app(args.profile)
+        users = setup(app, args.users, args.meetings, args.items, args.seed)
+        event.listen(Engine, "before_cursor_execute", _count_sql)
+        results = {}
+        print(f"{'scenario':<44} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'sql/req':>8} {'errors':>6}",
+              file=sys.stderr)
+        for name, fn in selected:
+            r = results[name] = run_scenario(app, fn, users, args.requests, args.concurrency, args.warmup, args.seed)
+            fmt = lambda v: f"{v:8.2f}" if v is not None else f"{'-':>8}"
+            print(f"{name:<44} {fmt(r['rps'])} {fmt(r['p50_ms'])} {fmt(r['p95_ms'])} {fmt(r['p99_ms'])} "
+                  f"{fmt(r['sql_per_request'])} {r['errors']:>6}", file=sys.stderr)
+        event.remove(Engine, "before_cursor_execute", _count_sql)
+    finally:
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "started_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "python": platform.python_version(),
+            "profile": args.profile,
+            "database": "sqlite (temp file)" if tmp else args.database_url.split("://")[0],
+            **{k: getattr(args, k) for k in ("users", "meetings", "items", "seed", "requests", "concurrency", "warmup")},
+        },
+        "results": results,
+    }
+    out = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(out + "\n")
+    else:
+        print(out)
+
+
+if __name__ == "__main__":
+    main()
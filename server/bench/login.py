@@ -0,0 +1,138 @@
+"""
+Login throughput benchmark: POST /auth/login under a burst, and what the burst
+does to CRUD latency, per bcrypt cost and hashing-pool size.
+
+    cd server
+    python bench/login.py --rounds 10,12 --pool 1,2,4 --threads 8 --seconds 10
+
+For every (rounds, pool) pair a fresh temp database is seeded with
+bench/datagen.py (hashes at that cost, so no rehash happens during the run).
+--threads client threads then log in back to back while one more thread
+loops over GET /meetings. Reported: logins/s, login p50/p95, 503s from a
+full hashing queue, and GET /meetings p95 during the burst (the number the
+pool size protects). Each run is its own process, because Config reads the
+environment at import time.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _pct(values, p):
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * p))] * 1000, 1) if values else None
+
+
+def run(threads, seconds, users):
+    """
+    One measurement, in a process whose environment already holds the config.
+    """
+    import contextlib
+    import io
+    from datetime import timedelta
+    from flask_jwt_extended import create_access_token
+    from flask_migrate import upgrade
+    from app import create_app
+    from datagen import PASSWORD, generate
+
+    app = create_app()
+    with app.app_context():
+        with contextlib.redirect_stderr(io.StringIO()):
+            upgrade(directory=os.path.join(SERVER, "migrations"))
+        created = generate(users, 20, 2)
+        headers = {"Authorization": f"Bearer {create_access_token(identity=str(created[0][0]), expires_delta=timedelta(hours=1))}"}
+
+    logins, crud, busy, failed = [], [], [0], [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def login_loop(n):
+        client = app.test_client()
+        i = n
+        while time.perf_counter() < deadline:
+            email = created[i % len(created)][1]
+            i += threads
+            started = time.perf_counter()
+            resp = client.post("/auth/login", json={"email": email, "password": PASSWORD})
+            elapsed = time.perf_counter() - started
+            with lock:
+                if resp.status_code == 200:
+                    logins.append(elapsed)
+                elif resp.status_code == 503:
+                    busy[0] += 1
+                else:
+                    failed[0] += 1
+
+    def crud_loop():
+        client = app.test_client()
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            client.get("/meetings", headers=headers)
+            crud.append(time.perf_counter() - started)
+
+    workers = [threading.Thread(target=login_loop, args=(n,)) for n in range(threads)]
+    workers.append(threading.Thread(target=crud_loop))
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return {
+        "logins_per_sec": round(len(logins) / seconds, 2),
+        "login_p50_ms": _pct(logins, 0.50),
+        "login_p95_ms": _pct(logins, 0.95),
+        "busy_503": busy[0],
+        "errors": failed[0],
+        "crud_p95_ms": _pct(crud, 0.95),
+        "crud_requests": len(crud),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", default="10,12", help="BCRYPT_LOG_ROUNDS values")
+    parser.add_argument("--pool", default="1,2,4", help="PASSWORD_HASH_CONCURRENCY values")
+    parser.add_argument("--max-pending", type=int, default=16, help="PASSWORD_HASH_MAX_PENDING")
+    parser.add_argument("--threads", type=int, default=8, help="concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--output", help="also write the results as JSON here")
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+    os.environ["PASSWORD_HASH_MAX_PENDING"] = str(args.max_pending)
+    results = []
+    print(f"{'rounds':>6} {'pool':>5} {'logins/s':>9} {'login p50':>10} {'login p95':>10} {'503s':>6} {'crud p95':>9}")
+    for rounds in args.rounds.split(","):
+        for pool in args.pool.split(","):
+            tmp = tempfile.mkdtemp(prefix="m2a-bench-")
+            os.environ.update(
+                DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                BCRYPT_LOG_ROUNDS=rounds,
+                PASSWORD_HASH_CONCURRENCY=pool,
+            )
+            try:
+                with mp.get_context("spawn").Pool(1) as p:
+                    r = p.apply(run, (args.threads, args.seconds, args.users))
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+            r.update(rounds=int(rounds), pool=int(pool), threads=args.threads)
+            results.append(r)
+            print(f"{rounds:>6} {pool:>5} {r['logins_per_sec']:>9.2f} {r['login_p50_ms'] or 0:>8.1f}ms "
+                  f"{r['login_p95_ms'] or 0:>8.1f}ms {r['busy_503']:>6} {r['crud_p95_ms'] or 0:>7.1f}ms")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"cpus": os.cpu_count(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Serialization micro-benchmark: time to build one list page (default 50 rows)
+of meetings and of action items, query + row-to-dict + JSON encoding.
+
+    cd server
+    python bench/serialize.py [--rows 50] [--repeat 200]
+
+Compares the old path (full ORM entities, hand-written dicts, stdlib JSON)
+with Marshmallow's schema.dump and with the current one (selected columns,
+compiled serializers from app/serializers.py, with and without orjson). Runs
+against a temp SQLite file seeded by bench/datagen.py.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_meeting_json(m):
+    return {
+        "id": m.id,
+        "title": m.title,
+        "date": m.date.isoformat(),
+        "attendees": m.attendees,
+        "notes": m.notes,
+        "created_at": m.created_at.isoformat(),
+        "updated_at": m.updated_at.isoformat() if m.updated_at else None,
+    }
+
+
+def legacy_item_json(it):
+    return {
+        "id": it.id,
+        "meeting_id": it.meeting_id,
+        "title": it.title,
+        "due_date": it.due_date.isoformat() if it.due_date else None,
+        "status": it.status,
+        "assignee": it.assignee,
+        "created_at": it.created_at.isoformat(),
+        "updated_at": it.updated_at.isoformat() if it.updated_at else None,
+    }
+
+
+def _time(fn, repeat):
+    """
+    Best-of-5 mean over `repeat` runs, in microseconds.
+    """
+    best = None
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = (time.perf_counter() - started) / repeat * 1e6
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50, help="rows per page")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="m2a-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    os.environ.setdefault("OPENAI_API_KEY", "unused")
+
+    import contextlib
+    import io
+    from flask.json.provider import DefaultJSONProvider
+    from flask_migrate import upgrade
+    from sqlalchemy.orm import undefer
+    from app import create_app, db
+    from app.action_items import ITEM_COLUMNS, items_query
+    from app.meetings import MEETING_COLUMNS, meetings_query
+    from app.models import Meeting
+    from app.schemas import ActionItemSchema, MeetingSchema
+    from app.serializers import OrjsonProvider, item_json, meeting_json, orjson
+    from datagen import generate
+
+    app = create_app()
+    std, fast = DefaultJSONProvider(app), OrjsonProvider(app) if orjson else None
+    try:
+        with app.app_context():
+            with contextlib.redirect_stderr(io.StringIO()):
+                upgrade(directory=os.path.join(SERVER, "migrations"))
+            uid = generate(1, max(args.rows * 2, 100), 3)[0][0]
+
+            cases = {
+                # notes is deferred on the model; the legacy path loaded it with the entity
+                "meetings": (lambda cols=None: meetings_query(uid, columns=cols) if cols
+                             else meetings_query(uid).options(undefer(Meeting.notes)), MEETING_COLUMNS,
+                             legacy_meeting_json, MeetingSchema(many=True, exclude=("user_id",)), meeting_json),
+                "items": (lambda cols=None: items_query(uid, columns=cols), ITEM_COLUMNS,
+                          legacy_item_json, ActionItemSchema(many=True, exclude=("user_id",)), item_json),
+            }
+            print(f"{args.rows}-row page, microseconds (best of 5 x {args.repeat})")
+            print(f"{'':<10} {'path':<34} {'query':>8} {'to dict':>8} {'encode':>8} {'total':>8} {'speedup':>8}")
+            for kind, (query, cols, legacy, schema, compiled) in cases.items():
+                def fetch(c=None):
+                    # a request starts with an empty session, so entities are rebuilt every time
+                    db.session.expunge_all()
+                    return query(c).limit(args.rows).all()
+
+                entities, rows = fetch(), fetch(cols)
+                assert [legacy(e) for e in entities] == [compiled(r) for r in rows]
+                paths = [
+                    ("entities + hand dicts + json", lambda: fetch(), lambda: [legacy(e) for e in entities], std),
+                    ("entities + marshmallow + json", lambda: fetch(), lambda: schema.dump(entities), std),
+                    ("columns + compiled + json", lambda: fetch(cols), lambda: [compiled(r) for r in rows], std),
+                ]
+                if fast:
+                    paths.append(
+                        ("columns + compiled + orjson", lambda: fetch(cols), lambda: [compiled(r) for r in rows], fast)
+                    )
+                baseline = None
+                for name, q, to_dict, provider in paths:
+                    body = {"items": to_dict()}
+                    t_q = _time(q, args.repeat)
+                    t_d = _time(to_dict, args.repeat)
+                    t_e = _time(lambda: provider.dumps(body), args.repeat)
+                    total = t_q + t_d + t_e
+                    baseline = baseline or total
+                    print(f"{kind:<10} {name:<34} {t_q:>8.0f} {t_d:>8.0f} {t_e:>8.0f} {total:>8.0f} "
+                          f"{baseline / total:>7.2f}x")
+            if not fast:
+                print("(orjson not installed; pip install orjson for the last path)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Add per-user data version counter for ETags
+
+Revision ID: 1f8d4c6a2e97
+Revises: e93a6b0d5c18
+Create Date: 2026-10-18 15:21:09.553410
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1f8d4c6a2e97'
+down_revision = 'e93a6b0d5c18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('data_version')
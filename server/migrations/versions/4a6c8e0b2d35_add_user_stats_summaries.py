@@ -0,0 +1,38 @@
+"""Add per-user summary counters for dashboard stats
+
+Revision ID: 4a6c8e0b2d35
+Revises: 9b3e5f7a1c24
+Create Date: 2026-10-18 17:14:26.990318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a6c8e0b2d35'
+down_revision = '9b3e5f7a1c24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('user_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('open_items', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('done_items', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('user_month_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('meetings', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'month')
+    )
+
+
+def downgrade():
+    op.drop_table('user_month_stats')
+    op.drop_table('user_stats')
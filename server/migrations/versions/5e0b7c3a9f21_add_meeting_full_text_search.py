@@ -0,0 +1,92 @@
+"""Add full-text search over meeting title, attendees and notes
+
+Revision ID: 5e0b7c3a9f21
+Revises: a41c9e2f7d10
+Create Date: 2026-10-18 10:02:17.845120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7c3a9f21'
+down_revision = 'a41c9e2f7d10'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE meeting_fts USING fts5(
+        title, attendees, notes,
+        content='meeting', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER meeting_fts_ai AFTER INSERT ON meeting BEGIN
+        INSERT INTO meeting_fts(rowid, title, attendees, notes)
+        VALUES (new.id, new.title, new.attendees, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER meeting_fts_ad AFTER DELETE ON meeting BEGIN
+        INSERT INTO meeting_fts(meeting_fts, rowid, title, attendees, notes)
+        VALUES ('delete', old.id, old.title, old.attendees, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER meeting_fts_au AFTER UPDATE OF title, attendees, notes ON meeting BEGIN
+        INSERT INTO meeting_fts(meeting_fts, rowid, title, attendees, notes)
+        VALUES ('delete', old.id, old.title, old.attendees, old.notes);
+        INSERT INTO meeting_fts(rowid, title, attendees, notes)
+        VALUES (new.id, new.title, new.attendees, new.notes);
+    END
+    """,
+    "INSERT INTO meeting_fts(meeting_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS meeting_fts_au",
+    "DROP TRIGGER IF EXISTS meeting_fts_ad",
+    "DROP TRIGGER IF EXISTS meeting_fts_ai",
+    "DROP TABLE IF EXISTS meeting_fts",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE meeting ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(attendees, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX ix_meeting_search_vector ON meeting USING GIN (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_meeting_search_vector",
+    "ALTER TABLE meeting DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements):
+    for stmt in statements:
+        op.execute(sa.text(stmt))
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_UPGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_UPGRADE)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        _run(SQLITE_DOWNGRADE)
+    elif dialect == 'postgresql':
+        _run(POSTGRES_DOWNGRADE)
@@ -0,0 +1,50 @@
+"""Add updated_at / sync_version columns and a tombstone table for delta sync
+
+Revision ID: 6c1e9a4f8b02
+Revises: d2a7f90c3b16
+Create Date: 2026-10-18 18:47:31.062914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6c1e9a4f8b02'
+down_revision = 'd2a7f90c3b16'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain ADD COLUMNs (no table rebuild), so the FTS triggers and the
+    # expression indexes on these tables are left alone.
+    for table in ('meeting', 'action_item'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.add_column(table, sa.Column('sync_version', sa.Integer(), server_default='0', nullable=False))
+        op.execute(sa.text(f'UPDATE {table} SET updated_at = created_at'))
+
+    op.create_table('tombstone',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('object_id', sa.Integer(), nullable=False),
+    sa.Column('sync_version', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_meeting_user_sync', 'meeting', ['user_id', 'sync_version'], unique=False)
+    op.create_index('ix_action_item_user_sync', 'action_item', ['user_id', 'sync_version'], unique=False)
+    op.create_index('ix_tombstone_user_sync', 'tombstone', ['user_id', 'sync_version'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tombstone_user_sync', table_name='tombstone')
+    op.drop_index('ix_action_item_user_sync', table_name='action_item')
+    op.drop_index('ix_meeting_user_sync', table_name='meeting')
+    op.drop_table('tombstone')
+    for table in ('action_item', 'meeting'):
+        # DROP COLUMN (SQLite >= 3.35) keeps the table, its triggers and indexes
+        op.drop_column(table, 'sync_version')
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,24 @@
+"""Add index on action_item.meeting_id
+
+Revision ID: 9b3e5f7a1c24
+Revises: 1f8d4c6a2e97
+Create Date: 2026-10-18 16:02:47.218903
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b3e5f7a1c24'
+down_revision = '1f8d4c6a2e97'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_action_item_meeting_id'), 'action_item', ['meeting_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_action_item_meeting_id'), table_name='action_item')
@@ -0,0 +1,37 @@
+"""Add composite indexes for meeting and action item list queries
+
+Revision ID: a41c9e2f7d10
+Revises: 7bbaa4685cfe
+Create Date: 2026-10-18 09:12:44.310582
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c9e2f7d10'
+down_revision = '7bbaa4685cfe'
+branch_labels = None
+depends_on = None
+
+
+DUE_ORDER = [sa.text('(due_date IS NULL)'), 'due_date', sa.text('id DESC')]
+OPEN_ONLY = sa.text("status = 'open'")
+
+
+def upgrade():
+    op.create_index('ix_meeting_user_date', 'meeting', ['user_id', 'date', 'id'], unique=False)
+    op.create_index('ix_action_item_user_due', 'action_item', ['user_id'] + DUE_ORDER, unique=False)
+    op.create_index('ix_action_item_user_status_due', 'action_item', ['user_id', 'status'] + DUE_ORDER, unique=False)
+    op.create_index(
+        'ix_action_item_open_due', 'action_item', ['user_id'] + DUE_ORDER, unique=False,
+        sqlite_where=OPEN_ONLY, postgresql_where=OPEN_ONLY,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_action_item_open_due', table_name='action_item')
+    op.drop_index('ix_action_item_user_status_due', table_name='action_item')
+    op.drop_index('ix_action_item_user_due', table_name='action_item')
+    op.drop_index('ix_meeting_user_date', table_name='meeting')
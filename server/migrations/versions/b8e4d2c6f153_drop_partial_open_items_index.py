@@ -0,0 +1,31 @@
+"""Drop the partial open-items index
+
+Revision ID: b8e4d2c6f153
+Revises: 6c1e9a4f8b02
+Create Date: 2026-10-18 16:40:12.518204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e4d2c6f153'
+down_revision = '6c1e9a4f8b02'
+branch_labels = None
+depends_on = None
+
+DUE_ORDER = [sa.text('(due_date IS NULL)'), 'due_date', sa.text('id DESC')]
+OPEN_ONLY = sa.text("status = 'open'")
+
+
+def upgrade():
+    # every status=open query is served by ix_action_item_user_status_due
+    op.drop_index('ix_action_item_open_due', table_name='action_item', if_exists=True)
+
+
+def downgrade():
+    op.create_index(
+        'ix_action_item_open_due', 'action_item', ['user_id'] + DUE_ORDER, unique=False,
+        sqlite_where=OPEN_ONLY, postgresql_where=OPEN_ONLY,
+    )
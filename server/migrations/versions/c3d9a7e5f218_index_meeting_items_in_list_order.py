@@ -0,0 +1,29 @@
+"""Index a meeting's action items in list order
+
+Revision ID: c3d9a7e5f218
+Revises: f1a3c5e7b924
+Create Date: 2026-10-18 18:12:09.274631
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d9a7e5f218'
+down_revision = 'f1a3c5e7b924'
+branch_labels = None
+depends_on = None
+
+DUE_ORDER = [sa.text('(due_date IS NULL)'), 'due_date', sa.text('id DESC')]
+
+
+def upgrade():
+    # (meeting_id, ITEM_SORT) replaces the plain meeting_id index: same prefix, no sort step
+    op.create_index('ix_action_item_meeting_due', 'action_item', ['meeting_id'] + DUE_ORDER, unique=False)
+    op.drop_index('ix_action_item_meeting_id', table_name='action_item', if_exists=True)
+
+
+def downgrade():
+    op.create_index('ix_action_item_meeting_id', 'action_item', ['meeting_id'], unique=False)
+    op.drop_index('ix_action_item_meeting_due', table_name='action_item')
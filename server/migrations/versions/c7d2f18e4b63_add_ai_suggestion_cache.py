@@ -0,0 +1,29 @@
+"""Add shared AI suggestion cache table
+
+Revision ID: c7d2f18e4b63
+Revises: 5e0b7c3a9f21
+Create Date: 2026-10-18 11:40:52.117306
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2f18e4b63'
+down_revision = '5e0b7c3a9f21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ai_suggestion_cache',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('items', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade():
+    op.drop_table('ai_suggestion_cache')
@@ -0,0 +1,107 @@
+"""Cascade deletes in the database on meeting/action item/user foreign keys
+
+Revision ID: d2a7f90c3b16
+Revises: 4a6c8e0b2d35
+Create Date: 2026-10-18 16:21:05.413870
+
+"""
+import warnings
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a7f90c3b16'
+down_revision = '4a6c8e0b2d35'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, referred table)
+FOREIGN_KEYS = [
+    ('action_item', 'meeting_id', 'meeting'),
+    ('action_item', 'user_id', 'user'),
+    ('meeting', 'user_id', 'user'),
+    ('user_stats', 'user_id', 'user'),
+    ('user_month_stats', 'user_id', 'user'),
+    ('ai_job', 'user_id', 'user'),
+]
+
+# SQLite FKs are unnamed; this names the reflected ones so batch mode can drop them.
+NAMING = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+# Rebuilding a SQLite table loses what reflection cannot carry over: the
+# expression/partial indexes from a41c9e2f7d10 and the FTS triggers from
+# 5e0b7c3a9f21. They are re-created after the rebuild.
+DUE_ORDER = [sa.text('(due_date IS NULL)'), 'due_date', sa.text('id DESC')]
+OPEN_ONLY = sa.text("status = 'open'")
+
+SQLITE_MEETING_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS meeting_fts_ai AFTER INSERT ON meeting BEGIN
+        INSERT INTO meeting_fts(rowid, title, attendees, notes)
+        VALUES (new.id, new.title, new.attendees, new.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meeting_fts_ad AFTER DELETE ON meeting BEGIN
+        INSERT INTO meeting_fts(meeting_fts, rowid, title, attendees, notes)
+        VALUES ('delete', old.id, old.title, old.attendees, old.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS meeting_fts_au AFTER UPDATE OF title, attendees, notes ON meeting BEGIN
+        INSERT INTO meeting_fts(meeting_fts, rowid, title, attendees, notes)
+        VALUES ('delete', old.id, old.title, old.attendees, old.notes);
+        INSERT INTO meeting_fts(rowid, title, attendees, notes)
+        VALUES (new.id, new.title, new.attendees, new.notes);
+    END
+    """,
+]
+
+
+def _restore_sqlite_extras(table):
+    if table == 'action_item':
+        op.create_index('ix_action_item_user_due', 'action_item', ['user_id'] + DUE_ORDER,
+                        unique=False, if_not_exists=True)
+        op.create_index('ix_action_item_user_status_due', 'action_item', ['user_id', 'status'] + DUE_ORDER,
+                        unique=False, if_not_exists=True)
+        op.create_index('ix_action_item_open_due', 'action_item', ['user_id'] + DUE_ORDER,
+                        unique=False, if_not_exists=True, sqlite_where=OPEN_ONLY)
+    elif table == 'meeting':
+        for stmt in SQLITE_MEETING_TRIGGERS:
+            op.execute(sa.text(stmt))
+
+
+def _set_ondelete(ondelete):
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        for table in dict.fromkeys(t for t, _, _ in FOREIGN_KEYS):
+            with warnings.catch_warnings():
+                # expected: the expression indexes are restored below
+                warnings.filterwarnings('ignore', 'Skipped unsupported reflection of expression-based index')
+                with op.batch_alter_table(table, naming_convention=NAMING) as batch_op:
+                    for t, column, referred in FOREIGN_KEYS:
+                        if t != table:
+                            continue
+                        name = NAMING['fk'] % {
+                            'table_name': t, 'column_0_name': column, 'referred_table_name': referred,
+                        }
+                        batch_op.drop_constraint(name, type_='foreignkey')
+                        batch_op.create_foreign_key(name, referred, [column], ['id'], ondelete=ondelete)
+            _restore_sqlite_extras(table)
+    else:
+        # PostgreSQL default constraint names: <table>_<column>_fkey
+        for table, column, referred in FOREIGN_KEYS:
+            name = f'{table}_{column}_fkey'
+            op.drop_constraint(name, table, type_='foreignkey')
+            op.create_foreign_key(name, table, referred, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade():
+    _set_ondelete('CASCADE')
+
+
+def downgrade():
+    _set_ondelete(None)
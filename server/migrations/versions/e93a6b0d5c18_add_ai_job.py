@@ -0,0 +1,39 @@
+"""Add AI job table for asynchronous suggestions
+
+Revision ID: e93a6b0d5c18
+Revises: c7d2f18e4b63
+Create Date: 2026-10-18 13:05:31.402867
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e93a6b0d5c18'
+down_revision = 'c7d2f18e4b63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ai_job',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('status', sa.String(length=10), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=False),
+    sa.Column('items', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ai_job_key'), 'ai_job', ['key'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_ai_job_key'), table_name='ai_job')
+    op.drop_table('ai_job')
@@ -0,0 +1,24 @@
+"""Index ai_suggestion_cache.created_at for pruning
+
+Revision ID: f1a3c5e7b924
+Revises: b8e4d2c6f153
+Create Date: 2026-10-18 17:05:41.903617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a3c5e7b924'
+down_revision = 'b8e4d2c6f153'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_ai_suggestion_cache_created_at'), 'ai_suggestion_cache', ['created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_ai_suggestion_cache_created_at'), table_name='ai_suggestion_cache')
@@ -0,0 +1,44 @@
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+SERVER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER)
+
+# Config reads the environment at import, so the database is chosen here,
+# before any test module imports `app`. TEST_DATABASE_URL (e.g. a throwaway
+# PostgreSQL database) is used as is; otherwise a fresh SQLite file.
+if os.getenv("TEST_DATABASE_URL"):
+    os.environ["DATABASE_URL"] = os.environ["TEST_DATABASE_URL"]
+else:
+    _tmp = tempfile.mkdtemp(prefix="m2a-test-")
+    atexit.register(shutil.rmtree, _tmp, ignore_errors=True)
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp, 'test.db')}"
+os.environ.setdefault("OPENAI_API_KEY", "unused")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    The app on the test database, migrated to head.
+    """
+    from flask_migrate import upgrade
+    from app import create_app
+
+    app = create_app()
+    with app.app_context():
+        with contextlib.redirect_stderr(io.StringIO()):
+            upgrade(directory=os.path.join(SERVER, "migrations"))
+        yield app
+
+
+@pytest.fixture
+def dialect(app):
+    from app import db
+    return db.engine.dialect.name
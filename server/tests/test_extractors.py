@@ -0,0 +1,31 @@
+from datetime import date
+
+import pytest
+from app.extractors import LocalExtractor, parse_action
+
+TODAY = date(2026, 10, 14)
+
+
+@pytest.mark.parametrize("sentence, title, assignee", [
+    ("Eve to test.", "Test", "Eve"),
+    ("Eve to test!", "Test", "Eve"),
+    ("Eve to review, then merge.", "Review, then merge", "Eve"),
+    ("Ann will send notes.", "Send notes", "Ann"),
+    ("Test.", "Test", None),
+    ("Follow-up with legal.", "Follow-up with legal", None),
+])
+def test_punctuated_first_word_is_still_a_verb(sentence, title, assignee):
+    cand = parse_action(sentence, TODAY)
+    assert cand is not None
+    assert (cand["title"], cand["assignee"]) == (title, assignee)
+
+
+@pytest.mark.parametrize("sentence", ["Max will be.", "Max will probably.", "Eve to lunch."])
+def test_punctuated_non_actions_are_dropped(sentence):
+    assert parse_action(sentence, TODAY) is None
+
+
+def test_local_extractor_on_punctuated_lines():
+    notes = "Eve: I need to test.\nBob will be.\nAnn to deploy; Max to check, by Friday."
+    titles = [c["title"] for c in LocalExtractor().extract(notes, TODAY)]
+    assert titles == ["Test", "Deploy", "Check"]
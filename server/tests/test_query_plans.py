@@ -0,0 +1,35 @@
+import pytest
+from app import db
+from app.cli import _bad_plan, _explain, list_query_cases
+
+
+def _plans():
+    with db.engine.connect() as conn:
+        for name, query in list_query_cases():
+            with conn.begin():
+                yield name, _explain(conn, query)
+
+
+def test_list_queries_are_index_backed(app, dialect):
+    """The check-query-plans cases: no full scan and no sort step in any plan."""
+    for name, lines in _plans():
+        assert _bad_plan(dialect, lines) is None, f"{name}:\n" + "\n".join(lines)
+
+
+@pytest.mark.parametrize("status", ["open", "done"])
+def test_status_filter_uses_status_index(app, status):
+    from app.action_items import items_query
+
+    with db.engine.connect() as conn, conn.begin():
+        plan = "\n".join(_explain(conn, items_query(1, status)))
+    assert "ix_action_item_user_status_due" in plan
+
+
+def test_postgresql_plans(app, dialect):
+    """Run with TEST_DATABASE_URL=postgresql://... (a throwaway database)."""
+    if dialect != "postgresql":
+        pytest.skip("needs TEST_DATABASE_URL pointing at a PostgreSQL database")
+    for name, lines in _plans():
+        plan = "\n".join(lines)
+        assert "Index" in plan, f"{name}: no index scan\n{plan}"
+        assert _bad_plan(dialect, lines) is None, f"{name}:\n{plan}"